@@ -27,6 +27,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=url.startswith("sqlite"),
+        compare_type=True,
     )
 
     with context.begin_transaction():
@@ -42,8 +44,12 @@ def run_migrations_online() -> None:
     connectable = create_engine(url, poolclass=pool.NullPool)
 
     with connectable.connect() as connection:
+        # SQLite no soporta ALTER TABLE completo: el modo batch recrea la
+        # tabla. En PostgreSQL se emiten los ALTER directamente.
         context.configure(connection=connection,
-                          target_metadata=target_metadata)
+                          target_metadata=target_metadata,
+                          render_as_batch=connection.dialect.name == "sqlite",
+                          compare_type=True)
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,30 @@
+"""Add deleted_at to events
+
+Revision ID: 5b2f0c8d1a47
+Revises: e36fd6701348
+Create Date: 2026-10-19 09:12:41.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2f0c8d1a47'
+down_revision: Union[str, Sequence[str], None] = 'e36fd6701348'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_events_deleted_at'), 'events', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_events_deleted_at'), table_name='events')
+    op.drop_column('events', 'deleted_at')
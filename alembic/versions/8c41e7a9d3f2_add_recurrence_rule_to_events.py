@@ -0,0 +1,28 @@
+"""Add recurrence rule to events
+
+Revision ID: 8c41e7a9d3f2
+Revises: 5b2f0c8d1a47
+Create Date: 2026-10-19 10:03:17.582930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41e7a9d3f2'
+down_revision: Union[str, Sequence[str], None] = '5b2f0c8d1a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('recurrence_rule', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('events', 'recurrence_rule')
@@ -0,0 +1,66 @@
+"""Add events archive
+
+Revision ID: a3c9e5f1b2d8
+Revises: f4a9c2d87b15
+Create Date: 2026-10-19 17:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e5f1b2d8'
+down_revision: Union[str, Sequence[str], None] = 'f4a9c2d87b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('events_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('start_date', sa.DateTime(), nullable=True),
+    sa.Column('end_date', sa.DateTime(), nullable=True),
+    sa.Column('start_time', sa.DateTime(), nullable=True),
+    sa.Column('prize', sa.String(), nullable=True),
+    sa.Column('location', sa.String(), nullable=True),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('recurrence_rule', sa.String(), nullable=True),
+    sa.Column('capacity', sa.Integer(), nullable=True),
+    sa.Column('seats_available', sa.Integer(), nullable=True),
+    sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_events_archive_category_id'), 'events_archive', ['category_id'], unique=False)
+    op.create_index(op.f('ix_events_archive_start_date'), 'events_archive', ['start_date'], unique=False)
+    op.create_table('event_attendees_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events_archive.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_event_attendees_archive_event_id'), 'event_attendees_archive', ['event_id'], unique=False)
+    # El archivador busca eventos terminados por end_date
+    op.create_index(op.f('ix_events_end_date'), 'events', ['end_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_events_end_date'), table_name='events')
+    op.drop_index(op.f('ix_event_attendees_archive_event_id'), table_name='event_attendees_archive')
+    op.drop_table('event_attendees_archive')
+    op.drop_index(op.f('ix_events_archive_start_date'), table_name='events_archive')
+    op.drop_index(op.f('ix_events_archive_category_id'), table_name='events_archive')
+    op.drop_table('events_archive')
@@ -0,0 +1,54 @@
+"""Add listing indexes
+
+Revision ID: b7d2e4f6a1c3
+Revises: a3c9e5f1b2d8
+Create Date: 2026-10-19 17:20:41.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f6a1c3'
+down_revision: Union[str, Sequence[str], None] = 'a3c9e5f1b2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Índice parcial: los listados nunca leen eventos con soft delete
+LIVE_EVENTS = sa.text('deleted_at IS NULL')
+
+
+def _create_indexes(**kw) -> None:
+    op.create_index('ix_events_category_id_start_date', 'events', ['category_id', 'start_date'], unique=False,
+                    postgresql_where=LIVE_EVENTS, sqlite_where=LIVE_EVENTS, **kw)
+    op.create_index(op.f('ix_events_user_id'), 'events', ['user_id'], unique=False, **kw)
+    op.create_index(op.f('ix_event_attendees_user_id'), 'event_attendees', ['user_id'], unique=False, **kw)
+
+
+def _drop_indexes(**kw) -> None:
+    op.drop_index(op.f('ix_event_attendees_user_id'), table_name='event_attendees', **kw)
+    op.drop_index(op.f('ix_events_user_id'), table_name='events', **kw)
+    op.drop_index('ix_events_category_id_start_date', table_name='events', **kw)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY no bloquea escrituras en tablas grandes, pero no puede
+        # ejecutarse dentro de una transacción
+        with op.get_context().autocommit_block():
+            _create_indexes(postgresql_concurrently=True)
+    else:
+        _create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            _drop_indexes(postgresql_concurrently=True)
+    else:
+        _drop_indexes()
@@ -0,0 +1,37 @@
+"""Add updated_at to events
+
+Revision ID: c5e8f0a2d4b6
+Revises: b7d2e4f6a1c3
+Create Date: 2026-10-19 17:41:07.215930
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8f0a2d4b6'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e4f6a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.add_column('events_archive', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    # Hora local, igual que los valores que escribe la aplicación
+    now = datetime.now()
+    op.execute(sa.text('UPDATE events SET updated_at = :now').bindparams(now=now))
+    op.execute(sa.text('UPDATE events_archive SET updated_at = archived_at'))
+    op.create_index(op.f('ix_events_updated_at'), 'events', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_events_updated_at'), table_name='events')
+    op.drop_column('events_archive', 'updated_at')
+    op.drop_column('events', 'updated_at')
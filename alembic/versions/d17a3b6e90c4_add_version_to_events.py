@@ -0,0 +1,28 @@
+"""Add version to events
+
+Revision ID: d17a3b6e90c4
+Revises: 8c41e7a9d3f2
+Create Date: 2026-10-19 11:26:52.117384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd17a3b6e90c4'
+down_revision: Union[str, Sequence[str], None] = '8c41e7a9d3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('events', 'version')
@@ -0,0 +1,47 @@
+"""Never reuse event ids on SQLite
+
+Revision ID: d9f1b3c5e7a2
+Revises: c5e8f0a2d4b6
+Create Date: 2026-10-19 18:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f1b3c5e7a2'
+down_revision: Union[str, Sequence[str], None] = 'c5e8f0a2d4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_events(autoincrement: bool) -> None:
+    with op.batch_alter_table('events', recreate='always',
+                              table_kwargs={'sqlite_autoincrement': autoincrement}):
+        pass
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL usa una secuencia que nunca reutiliza ids; solo SQLite
+    # devolvía el id más alto tras archivarlo o purgarlo
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _recreate_events(autoincrement=True)
+    # La secuencia arranca por encima de cualquier id ya archivado
+    op.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = 'events'"))
+    op.execute(sa.text(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'events', MAX("
+        "COALESCE((SELECT MAX(id) FROM events), 0), "
+        "COALESCE((SELECT MAX(id) FROM events_archive), 0))"
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _recreate_events(autoincrement=False)
@@ -0,0 +1,44 @@
+"""Add capacity and event attendees
+
+Revision ID: f4a9c2d87b15
+Revises: d17a3b6e90c4
+Create Date: 2026-10-19 12:48:05.361920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a9c2d87b15'
+down_revision: Union[str, Sequence[str], None] = 'd17a3b6e90c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('capacity', sa.Integer(), nullable=True))
+    op.add_column('events', sa.Column('seats_available', sa.Integer(), nullable=True))
+    op.create_table('event_attendees',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_event_attendees_id'), 'event_attendees', ['id'], unique=False)
+    op.create_index('ix_event_attendees_event_id_user_id', 'event_attendees', ['event_id', 'user_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_event_attendees_event_id_user_id', table_name='event_attendees')
+    op.drop_index(op.f('ix_event_attendees_id'), table_name='event_attendees')
+    op.drop_table('event_attendees')
+    op.drop_column('events', 'seats_available')
+    op.drop_column('events', 'capacity')
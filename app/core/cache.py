@@ -0,0 +1,284 @@
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - dependencia opcional
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """In-process LRU with per-entry TTL, bounded by entry count and bytes."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires_at, size = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float, size: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (value, time.monotonic() + ttl_seconds, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+
+
+class CacheBackend(ABC):
+    """Shared (L2) cache backend storing raw bytes."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+
+class InMemoryBackend(CacheBackend):
+    """Process-local stand-in for a shared backend, with Redis GET/SET EX/DEL semantics."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class RedisBackend(CacheBackend):
+    def __init__(self, url: str):
+        if redis is None:
+            raise RuntimeError("The redis package is required for CACHE_BACKEND=redis")
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self._client.set(key, value, ex=ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+
+class Cache:
+    """Two-tier cache for one namespace.
+
+    Values must be JSON serialisable. ``None`` returned by a loader is cached
+    as a negative entry (e.g. a 404) for ``negative_ttl_seconds``. Concurrent
+    misses on the same key are collapsed into a single loader call.
+
+    ``delete`` only reaches this process's L1, so ``l1_ttl_seconds`` caps how
+    long other workers can keep serving an entry after it changed.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        l1: LRUCache,
+        l2: Optional[CacheBackend] = None,
+        ttl_seconds: int = 60,
+        negative_ttl_seconds: int = 10,
+        l1_ttl_seconds: Optional[float] = None,
+    ):
+        self.namespace = namespace
+        self.l1 = l1
+        self.l2 = l2
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self._inflight: Dict[str, threading.Event] = {}
+        self._invalidated = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._requests = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _l1_ttl(self, ttl: float) -> float:
+        if self.l1_ttl_seconds is None:
+            return ttl
+        return min(ttl, self.l1_ttl_seconds)
+
+    def _record(self, outcome: str) -> None:
+        metrics.incr(f"cache.{self.namespace}.{outcome}")
+        with self._lock:
+            self._requests += 1
+            if outcome != "miss":
+                self._hits += 1
+            ratio = self._hits / self._requests
+        metrics.gauge(f"cache.{self.namespace}.hit_ratio", ratio)
+
+    def _lookup(self, key: str) -> Any:
+        value = self.l1.get(self._key(key))
+        if value is not _MISSING:
+            self._record("l1_hit")
+            return value
+
+        if self.l2 is not None:
+            try:
+                raw = self.l2.get(self._key(key))
+            except Exception as e:
+                logger.warning(f"Cache backend error on get: {str(e)}")
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                ttl = (
+                    self.ttl_seconds if value is not None else self.negative_ttl_seconds
+                )
+                self.l1.set(self._key(key), value, self._l1_ttl(ttl), len(raw))
+                self._record("l2_hit")
+                return value
+
+        return _MISSING
+
+    def set(self, key: str, value: Any) -> None:
+        raw = json.dumps(value).encode()
+        ttl = self.ttl_seconds if value is not None else self.negative_ttl_seconds
+        self.l1.set(self._key(key), value, self._l1_ttl(ttl), len(raw))
+        if self.l2 is not None:
+            try:
+                self.l2.set(self._key(key), raw, ttl)
+            except Exception as e:
+                logger.warning(f"Cache backend error on set: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._inflight:
+                # Una carga en curso puede traer datos anteriores al cambio
+                self._invalidated.add(key)
+        self.l1.delete(self._key(key))
+        if self.l2 is not None:
+            try:
+                self.l2.delete(self._key(key))
+            except Exception as e:
+                logger.warning(f"Cache backend error on delete: {str(e)}")
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            inflight = self._inflight.get(key)
+            leader = inflight is None
+            if leader:
+                inflight = self._inflight[key] = threading.Event()
+
+        if not leader:
+            # Otro hilo ya está cargando esta clave: esperar su resultado
+            inflight.wait(timeout=5)
+            value = self.l1.get(self._key(key))
+            if value is not _MISSING:
+                self._record("coalesced")
+                return value
+
+        try:
+            self._record("miss")
+            value = loader()
+            with self._lock:
+                stale = key in self._invalidated
+            if not stale:
+                self.set(key, value)
+            return value
+        finally:
+            if leader:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                    self._invalidated.discard(key)
+                inflight.set()
+
+
+_l1 = LRUCache(
+    max_entries=settings.cache_l1_max_entries,
+    max_bytes=settings.cache_l1_max_bytes,
+)
+
+
+def _shared_backend() -> Optional[CacheBackend]:
+    if settings.cache_backend == "redis":
+        return RedisBackend(settings.cache_redis_url)
+    if settings.cache_backend == "memory":
+        return InMemoryBackend()
+    return None
+
+
+_l2 = _shared_backend()
+
+event_cache = Cache(
+    "events",
+    _l1,
+    _l2,
+    ttl_seconds=settings.cache_default_ttl_seconds,
+    negative_ttl_seconds=settings.cache_negative_ttl_seconds,
+    # version y seats_available cambian a menudo: el ETag de otro worker
+    # no puede quedarse atrás más de unos segundos
+    l1_ttl_seconds=settings.cache_events_l1_ttl_seconds,
+)
+user_cache = Cache(
+    "users",
+    _l1,
+    _l2,
+    ttl_seconds=settings.cache_default_ttl_seconds,
+    negative_ttl_seconds=settings.cache_negative_ttl_seconds,
+)
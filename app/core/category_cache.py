@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import SessionLocal
+from app.models.category import Category as CategoryModel
+from app.schemas.category import Category
+
+
+class CategoryCache:
+    """In-process copy of the categories table.
+
+    The table holds a handful of seeded rows, so it is loaded whole and
+    swapped atomically on every reload; ``version`` increases each time.
+    It is reloaded when older than ``ttl_seconds`` or when an unknown id is
+    requested, which picks up categories added by other processes. Ids still
+    unknown after that reload are remembered as missing until the next
+    reload, and concurrent misses share a single reload.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._by_id: Dict[int, Category] = {}
+        self._missing: Set[int] = set()
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+
+    def load(self, db: Optional[Session] = None) -> None:
+        session_created = False
+        if db is None:
+            db = SessionLocal()
+            session_created = True
+
+        try:
+            rows = db.query(CategoryModel).all()
+            by_id = {row.id: Category.model_validate(row) for row in rows}
+        finally:
+            if session_created:
+                db.close()
+
+        with self._lock:
+            self._by_id = by_id
+            self._missing = set()
+            self._loaded_at = time.monotonic()
+            self.version += 1
+        metrics.incr("categories.cache.reloads")
+
+    def invalidate(self) -> None:
+        self.load()
+
+    def _ensure_fresh(self) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.ttl_seconds:
+            self.load()
+
+    def _reload_for(self, ids: Set[int]) -> None:
+        unknown = ids - self._by_id.keys() - self._missing
+        if not unknown:
+            return
+        version = self.version
+        with self._reload_lock:
+            # Si otra petición recargó mientras se esperaba, esa foto ya sirve
+            if self.version == version:
+                self.load()
+            metrics.incr("categories.cache.misses", len(unknown))
+            with self._lock:
+                self._missing.update(i for i in unknown if i not in self._by_id)
+
+    def get(self, category_id: int) -> Optional[Category]:
+        self._ensure_fresh()
+        if category_id not in self._by_id:
+            self._reload_for({category_id})
+        return self._by_id.get(category_id)
+
+    def get_many(self, category_ids: Iterable[int]) -> Dict[int, Category]:
+        self._ensure_fresh()
+        ids = set(category_ids)
+        if not ids.issubset(self._by_id):
+            self._reload_for(ids)
+        return {i: self._by_id[i] for i in ids if i in self._by_id}
+
+    def all(self) -> List[Category]:
+        self._ensure_fresh()
+        return list(self._by_id.values())
+
+
+category_cache = CategoryCache(ttl_seconds=settings.category_cache_ttl_seconds)
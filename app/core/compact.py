@@ -0,0 +1,77 @@
+import json
+from datetime import date, datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, Response, status
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - dependencia opcional
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+# Eventos sin objetos anidados; categorías y usuarios van aparte, por id
+NORMALIZED_MEDIA_TYPE = "application/vnd.imagineapps.normalized+json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+_ALIASES = {
+    "*/*": JSON_MEDIA_TYPE,
+    "application/*": JSON_MEDIA_TYPE,
+    JSON_MEDIA_TYPE: JSON_MEDIA_TYPE,
+    NORMALIZED_MEDIA_TYPE: NORMALIZED_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE: MSGPACK_MEDIA_TYPE,
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+}
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Pick the response media type from an ``Accept`` header.
+
+    Raises 406 when nothing acceptable can be produced (including
+    MessagePack when the ``msgpack`` package is not installed).
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    candidates = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [piece.strip() for piece in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media_type.lower()))
+
+    for _, _, media_type in sorted(candidates):
+        chosen = _ALIASES.get(media_type)
+        if chosen == MSGPACK_MEDIA_TYPE and msgpack is None:
+            continue
+        if chosen is not None:
+            return chosen
+
+    raise HTTPException(
+        status_code=status.HTTP_406_NOT_ACCEPTABLE,
+        detail=f"Supported media types: {JSON_MEDIA_TYPE}, "
+        f"{NORMALIZED_MEDIA_TYPE}"
+        + (f", {MSGPACK_MEDIA_TYPE}" if msgpack is not None else ""),
+    )
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def encode(payload: Any, media_type: str) -> Response:
+    if media_type == MSGPACK_MEDIA_TYPE:
+        content = msgpack.packb(payload, default=_default, use_bin_type=True)
+    else:
+        content = json.dumps(
+            payload, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+    return Response(content=content, media_type=media_type, headers={"Vary": "Accept"})
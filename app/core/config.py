@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,6 +10,85 @@ class Settings(BaseSettings):
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+
+    # Pool de conexiones (solo PostgreSQL; SQLite usa los valores por defecto)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle_seconds: int = 1800
+
+    log_level: str = "INFO"
+    # Fracción de logs INFO/DEBUG que se emiten; WARNING y superiores siempre
+    log_info_sample_rate: float = 1.0
+
+    # Perfilado de peticiones: cabecera X-Profile con el ADMIN_TOKEN o muestreo
+    admin_token: Optional[str] = None
+    profiling_sample_rate: float = 0.0
+    profiling_keep_slowest: int = 20
+    profiling_top_functions: int = 30
+
+    # Purga definitiva de eventos con soft delete
+    purge_enabled: bool = True
+    purge_interval_seconds: int = 300
+    purge_retention_seconds: int = 3600
+    # Ids purgados que las sincronizaciones delta siguen informando
+    purge_tombstone_retention_days: int = 30
+    purge_batch_size: int = 500
+    purge_max_inflight_requests: int = 2
+
+    # Archivado de eventos terminados en events_archive
+    archive_enabled: bool = True
+    archive_interval_seconds: int = 3600
+    archive_retention_days: int = 30
+    archive_batch_size: int = 1000
+    archive_max_inflight_requests: int = 2
+
+    # Cola de tareas en segundo plano con outbox persistente en SQLite
+    jobs_enabled: bool = True
+    jobs_outbox_path: str = "data/outbox.db"
+    jobs_workers: int = 4
+    jobs_queue_capacity: int = 1000
+    jobs_max_attempts: int = 5
+    jobs_retry_backoff_seconds: float = 2.0
+    jobs_poll_interval_seconds: float = 5.0
+
+    category_cache_ttl_seconds: int = 300
+
+    events_batch_max_ids: int = 100
+    # updated_since: el server_time devuelto retrocede este margen para no
+    # perder escrituras que hicieron flush antes de leerlo y commit después
+    events_delta_overlap_seconds: int = 30
+    # POST /query: máximo de filas por nivel y de ids por consulta IN
+    query_max_limit: int = 500
+    query_in_chunk_size: int = 500
+
+    # Caché de dos niveles: L1 en proceso y L2 compartida opcional
+    # (cache_backend: "none", "memory" o "redis")
+    cache_backend: str = "none"
+    cache_redis_url: Optional[str] = None
+    cache_l1_max_entries: int = 10000
+    cache_l1_max_bytes: int = 64 * 1024 * 1024
+    cache_default_ttl_seconds: int = 60
+    cache_negative_ttl_seconds: int = 10
+    # Las invalidaciones no llegan a la L1 de los demás workers
+    cache_events_l1_ttl_seconds: int = 2
+
+    # GET /events/upcoming: los próximos head_size eventos de cada ámbito
+    # (todos y cada categoría pedida), recargados cada reload_seconds.
+    # head_size por encima de max_limit evita rellenar en cada expiración
+    upcoming_enabled: bool = True
+    upcoming_horizon_days: int = 365
+    upcoming_head_size: int = 200
+    upcoming_tick_seconds: int = 30
+    upcoming_reload_seconds: int = 600
+    upcoming_max_limit: int = 100
+
+    ics_cache_ttl_seconds: int = 600
+    ics_stream_chunk_size: int = 500
+
+    # Idempotency-Key para POST /events y POST /auth/register
+    idempotency_store_path: str = "data/idempotency.db"
+    idempotency_ttl_seconds: int = 86400
+    idempotency_max_entries: int = 10000
     
     class Config:
         env_file = ".env"
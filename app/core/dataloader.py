@@ -0,0 +1,36 @@
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+from app.core.metrics import metrics
+
+
+class DataLoader:
+    """Per-request batching loader.
+
+    Resolvers collect every key needed at one level of the response and call
+    ``load_many`` once; keys are deduplicated, previously loaded keys are
+    served from the loader's cache and the rest are fetched with a single
+    ``batch_fn`` call per ``chunk_size`` keys. Keys ``batch_fn`` does not
+    return are cached as missing.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        chunk_size: int = 500,
+        name: str = "loader",
+    ):
+        self.batch_fn = batch_fn
+        self.chunk_size = chunk_size
+        self.name = name
+        self._cache: Dict[Hashable, Any] = {}
+
+    def load_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        wanted = [key for key in dict.fromkeys(keys) if key is not None]
+        missing = [key for key in wanted if key not in self._cache]
+        for start in range(0, len(missing), self.chunk_size):
+            chunk = missing[start : start + self.chunk_size]
+            loaded = self.batch_fn(chunk)
+            metrics.incr(f"dataloader.{self.name}.batches")
+            for key in chunk:
+                self._cache[key] = loaded.get(key)
+        return {key: self._cache[key] for key in wanted}
@@ -0,0 +1,196 @@
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+# Los ETag incluyen un identificador del proceso: tras un reinicio la
+# generación vuelve a 0 y no debe coincidir con ETags antiguos.
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+
+def etag_for(generation: int) -> str:
+    return f'"{_BOOT_ID}-{generation}"'
+
+
+def _escape(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    # RFC 5545: líneas de máximo 75 octetos, continuadas con un espacio
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        char_size = len(char.encode())
+        if size + char_size > (75 if not parts else 74):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_dt(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def calendar_header(name: str) -> str:
+    return (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        "PRODID:-//ImagineApps//Events//ES\r\n"
+        "CALSCALE:GREGORIAN\r\n" + _fold(f"X-WR-CALNAME:{_escape(name)}")
+    )
+
+
+def vevent(event) -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{event.id}@imagineapps",
+        f"DTSTAMP:{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}",
+        f"SEQUENCE:{event.version}",
+        f"DTSTART:{_format_dt(event.start_date)}",
+        f"DTEND:{_format_dt(event.end_date)}",
+        f"SUMMARY:{_escape(event.name)}",
+        f"DESCRIPTION:{_escape(event.description)}",
+        f"LOCATION:{_escape(event.location)}",
+    ]
+    if event.recurrence_rule:
+        rule = event.recurrence_rule
+        lines.append(rule if rule.upper().startswith("RRULE:") else f"RRULE:{rule}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+@dataclass
+class CalendarFeed:
+    header: str
+    components: Dict[int, str]
+    generation: int
+    last_modified: datetime
+    built_at: float
+    dirty: Set[int] = field(default_factory=set)
+
+    @property
+    def etag(self) -> str:
+        return etag_for(self.generation)
+
+    def render(self) -> str:
+        return self.header + "".join(self.components.values()) + CALENDAR_FOOTER
+
+
+class CalendarFeedCache:
+    """Per-category .ics documents, patched incrementally on event writes.
+
+    An event write only marks that event dirty; the next request regenerates
+    the VEVENT blocks of dirty events and reuses the rest. Patched components
+    are swapped in as a new dict, so ``render`` never needs the lock. ``generation``
+    increases on every invalidation and is exposed through the ETag.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._feeds: Dict[int, CalendarFeed] = {}
+        self._generations: Dict[int, int] = {}
+        self._event_category: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, category_id: int) -> int:
+        with self._lock:
+            return self._generations.get(category_id, 0)
+
+    def get(self, category_id: int) -> Optional[CalendarFeed]:
+        with self._lock:
+            feed = self._feeds.get(category_id)
+            if feed is not None and time.monotonic() - feed.built_at > self.ttl_seconds:
+                # Red de seguridad para escrituras hechas por otros procesos
+                del self._feeds[category_id]
+                feed = None
+        metrics.incr("ics.cache.hit" if feed is not None else "ics.cache.miss")
+        return feed
+
+    def store(
+        self, category_id: int, header: str, components: Dict[int, str], generation: int
+    ) -> Optional[CalendarFeed]:
+        with self._lock:
+            if self._generations.get(category_id, 0) != generation:
+                # Hubo escrituras mientras se generaba; no guardar
+                return None
+            feed = CalendarFeed(
+                header=header,
+                components=components,
+                generation=generation,
+                last_modified=datetime.now(timezone.utc).replace(microsecond=0),
+                built_at=time.monotonic(),
+            )
+            self._feeds[category_id] = feed
+            for event_id in components:
+                self._event_category[event_id] = category_id
+            return feed
+
+    def dirty_ids(self, feed: CalendarFeed) -> Tuple[List[int], int]:
+        with self._lock:
+            return list(feed.dirty), feed.generation
+
+    def apply(
+        self,
+        category_id: int,
+        feed: CalendarFeed,
+        dirty: List[int],
+        generation: int,
+        events: Iterable,
+    ) -> None:
+        """Replace the ``dirty`` components of ``feed`` with fresh ``events``.
+
+        Events missing from ``events`` were deleted or moved to another
+        category and are dropped from the feed.
+        """
+        refreshed = {event.id: vevent(event) for event in events}
+        with self._lock:
+            # Copia y sustitución: render() recorre el dict sin el lock, así
+            # que el que ya publicó un feed no se modifica nunca
+            components = dict(feed.components)
+            for event_id in dirty:
+                components.pop(event_id, None)
+                self._event_category.pop(event_id, None)
+            for event_id, component in refreshed.items():
+                components[event_id] = component
+                self._event_category[event_id] = category_id
+            feed.components = components
+            if feed.generation == generation:
+                feed.dirty.difference_update(dirty)
+
+    def invalidate_event(
+        self, event_id: int, category_id: Optional[int] = None
+    ) -> None:
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        with self._lock:
+            categories = {category_id, self._event_category.get(event_id)} - {None}
+            for category in categories:
+                self._generations[category] = self._generations.get(category, 0) + 1
+                feed = self._feeds.get(category)
+                if feed is not None:
+                    feed.dirty.add(event_id)
+                    feed.generation = self._generations[category]
+                    feed.last_modified = now
+
+
+calendar_feed_cache = CalendarFeedCache(ttl_seconds=settings.ics_cache_ttl_seconds)
@@ -0,0 +1,160 @@
+import hashlib
+import hmac
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Response, status
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.local_store import open_local_db
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StoredResponse:
+    fingerprint: bytes
+    status_code: int
+    body: bytes
+    expires_at: float
+
+    def to_response(self) -> Response:
+        return Response(
+            content=zlib.decompress(self.body),
+            status_code=self.status_code,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+
+def request_fingerprint(*parts: str) -> bytes:
+    # HMAC en lugar de un hash simple: el cuerpo puede incluir contraseñas
+    message = "\n".join(parts).encode()
+    return hmac.new(settings.secret_key.encode(), message, hashlib.sha256).digest()
+
+
+class IdempotencyStore:
+    """Responses keyed by ``Idempotency-Key`` with TTL eviction.
+
+    Entries live in an insertion-ordered dict (all share the same TTL, so the
+    oldest entry is always the next to expire) and are written through to a
+    local SQLite file, which is consulted on a memory miss.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self._pending: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._conn = None
+        self._writes = 0
+
+    def _db(self):
+        if self._conn is None:
+            self._conn = open_local_db(self.path)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS idempotency_keys (
+                    key TEXT PRIMARY KEY,
+                    fingerprint BLOB NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    body BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+        return self._conn
+
+    def _evict(self, now: float) -> None:
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str, now: float) -> Optional[StoredResponse]:
+        try:
+            row = (
+                self._db()
+                .execute(
+                    "SELECT fingerprint, status_code, body, expires_at "
+                    "FROM idempotency_keys WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                )
+                .fetchone()
+            )
+        except Exception as e:
+            logger.error(f"Error reading idempotency store: {str(e)}")
+            return None
+        return StoredResponse(*row) if row else None
+
+    def begin(self, key: str, fingerprint: bytes) -> Optional[StoredResponse]:
+        """Return the stored response for ``key`` or reserve the key."""
+        now = time.time()
+        with self._lock:
+            self._evict(now)
+            entry = self._entries.get(key) or self._load(key, now)
+            if entry is not None:
+                if not hmac.compare_digest(entry.fingerprint, fingerprint):
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail="Idempotency-Key reused with a different request",
+                    )
+                metrics.incr("idempotency.replays")
+                return entry
+            if key in self._pending:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with this Idempotency-Key is in progress",
+                )
+            self._pending[key] = fingerprint
+            return None
+
+    def complete(
+        self, key: str, fingerprint: bytes, status_code: int, body: bytes
+    ) -> None:
+        now = time.time()
+        entry = StoredResponse(
+            fingerprint=fingerprint,
+            status_code=status_code,
+            body=zlib.compress(body),
+            expires_at=now + self.ttl_seconds,
+        )
+        with self._lock:
+            self._pending.pop(key, None)
+            self._entries[key] = entry
+            self._evict(now)
+            try:
+                db = self._db()
+                db.execute(
+                    "INSERT OR REPLACE INTO idempotency_keys "
+                    "(key, fingerprint, status_code, body, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, entry.fingerprint, status_code, entry.body, entry.expires_at),
+                )
+                self._writes += 1
+                if self._writes % 1000 == 0:
+                    db.execute(
+                        "DELETE FROM idempotency_keys WHERE expires_at <= ?", (now,)
+                    )
+            except Exception as e:
+                logger.error(f"Error writing idempotency store: {str(e)}")
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+
+idempotency_store = IdempotencyStore(
+    path=settings.idempotency_store_path,
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    max_entries=settings.idempotency_max_entries,
+)
@@ -0,0 +1,307 @@
+import asyncio
+import cProfile
+import functools
+import heapq
+import hmac
+import io
+import itertools
+import pstats
+import random
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import Header, HTTPException, Request, status
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
+from app.core.config import settings
+from app.core.logging_config import request_id_var
+from app.core.metrics import metrics
+from app.db.session import engine
+
+PROFILE_HEADER = "X-Profile"
+
+# cProfile no admite varios perfiladores activos a la vez en todas las
+# versiones de Python: solo una petición a la vez recoge estadísticas por
+# función; las demás registran únicamente los tiempos por fase.
+_profiler_lock = threading.Lock()
+
+
+class RequestProfile:
+    """Timings and cProfile data collected for a single request.
+
+    Phases reported by ``summary``:
+
+    - db: time spent executing SQL (cursor execute to fetch start).
+    - hydrate: fetching rows and building ORM instances, measured from the
+      end of each statement to the last instance loaded from it.
+    - validate: the rest of the route, i.e. dependency resolution, Pydantic
+      models built inside the endpoint and response-model validation.
+    - serialize: JSON encoding of the response body.
+    - other: middleware and routing outside the route.
+    """
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.request_id = request_id_var.get()
+        self.started_at = datetime.now(timezone.utc)
+        self.profiler = (
+            cProfile.Profile() if _profiler_lock.acquire(blocking=False) else None
+        )
+        self.db_seconds = 0.0
+        self.queries = 0
+        self.hydrate_seconds = 0.0
+        self.hydrate_mark: Optional[float] = None
+        self.route_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+    def enable(self) -> None:
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def disable(self) -> None:
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def close(self) -> None:
+        if self.profiler is not None:
+            self.profiler = None
+            _profiler_lock.release()
+
+    def summary(self, status_code: int, total_seconds: float) -> Dict[str, Any]:
+        phases = {
+            "db": self.db_seconds,
+            "hydrate": self.hydrate_seconds,
+            "validate": self.route_seconds
+            - self.db_seconds
+            - self.hydrate_seconds
+            - self.serialize_seconds,
+            "serialize": self.serialize_seconds,
+            "other": total_seconds - self.route_seconds,
+        }
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status_code": status_code,
+            "request_id": self.request_id,
+            "started_at": self.started_at.isoformat(),
+            "total_ms": round(total_seconds * 1000, 3),
+            "queries": self.queries,
+            "phases_ms": {
+                name: round(max(seconds, 0.0) * 1000, 3)
+                for name, seconds in phases.items()
+            },
+        }
+
+    def top_functions(self, limit: int) -> str:
+        if self.profiler is None:
+            return ""
+        output = io.StringIO()
+        try:
+            stats = pstats.Stats(self.profiler, stream=output)
+        except TypeError:
+            # El perfilador no llegó a activarse (la ruta no usa ProfiledRoute)
+            return ""
+        stats.sort_stats("cumulative").print_stats(limit)
+        return output.getvalue()
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "current_profile", default=None
+)
+
+
+class ProfileStore:
+    """Keeps the ``max_entries`` slowest profiled requests.
+
+    A min-heap ordered by total time: a new profile only displaces the
+    fastest one kept so far.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._heap: List[tuple] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            entry["id"] = next(self._ids)
+            item = (entry["total_ms"], entry["id"], entry)
+            if len(self._heap) < self.max_entries:
+                heapq.heappush(self._heap, item)
+            elif item[0] > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            entries = [entry for _, _, entry in self._heap]
+        entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return [
+            {key: value for key, value in entry.items() if key != "profile"}
+            for entry in entries
+        ]
+
+    def get(self, profile_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for _, entry_id, entry in self._heap:
+                if entry_id == profile_id:
+                    return entry
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap = []
+
+
+profile_store = ProfileStore(max_entries=settings.profiling_keep_slowest)
+
+
+def _is_admin_token(value: Optional[str]) -> bool:
+    token = settings.admin_token
+    if not token or not value:
+        return False
+    return hmac.compare_digest(value.encode(), token.encode())
+
+
+def should_profile(request: Request) -> bool:
+    if _is_admin_token(request.headers.get(PROFILE_HEADER)):
+        return True
+    rate = settings.profiling_sample_rate
+    return rate > 0 and random.random() < rate
+
+
+def start_profile(request: Request):
+    """Activate profiling for the current request; pass the result to ``finish_profile``."""
+    profile = RequestProfile(request.method, request.url.path)
+    return _current_profile.set(profile), time.perf_counter()
+
+
+def finish_profile(handle, status_code: int) -> None:
+    token, started = handle
+    total_seconds = time.perf_counter() - started
+    profile = _current_profile.get()
+    _current_profile.reset(token)
+    if profile is None:
+        return
+    entry = profile.summary(status_code, total_seconds)
+    entry["profile"] = profile.top_functions(settings.profiling_top_functions)
+    profile.close()
+    profile_store.add(entry)
+    metrics.incr("profiling.captured")
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    # Sin ADMIN_TOKEN configurado los endpoints de administración quedan cerrados
+    if not _is_admin_token(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin token required",
+        )
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("profile_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    starts = conn.info.get("profile_query_start")
+    if profile is None or not starts:
+        return
+    now = time.perf_counter()
+    profile.db_seconds += now - starts.pop()
+    profile.queries += 1
+    # A partir de aquí el ORM lee filas y construye instancias
+    profile.hydrate_mark = now
+
+
+@event.listens_for(Mapper, "load")
+def _after_instance_load(target, context):
+    profile = _current_profile.get()
+    if profile is None or profile.hydrate_mark is None:
+        return
+    now = time.perf_counter()
+    profile.hydrate_seconds += now - profile.hydrate_mark
+    profile.hydrate_mark = now
+
+
+@event.listens_for(Mapper, "refresh")
+def _after_instance_refresh(target, context, attrs):
+    _after_instance_load(target, context)
+
+
+class ProfiledJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        profile = _current_profile.get()
+        if profile is None:
+            return super().render(content)
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            return super().render(content)
+        finally:
+            profile.disable()
+            profile.serialize_seconds += time.perf_counter() - started
+
+
+def _profiled_endpoint(call):
+    # cProfile solo sigue el hilo que lo activa: en endpoints async las
+    # esperas mezclarían otras peticiones, así que se dejan sin perfilar
+    if asyncio.iscoroutinefunction(call):
+        return call
+
+    @functools.wraps(call)
+    def profiled(**values):
+        profile = _current_profile.get()
+        if profile is None:
+            return call(**values)
+        profile.enable()
+        try:
+            return call(**values)
+        finally:
+            profile.disable()
+
+    return profiled
+
+
+class ProfiledRoute(APIRoute):
+    """APIRoute that reports per-phase timings for profiled requests.
+
+    Requests that are not being profiled only pay a context variable lookup.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        response_class = kwargs.get("response_class", Default(JSONResponse))
+        if (
+            isinstance(response_class, DefaultPlaceholder)
+            and response_class.value is JSONResponse
+        ):
+            kwargs["response_class"] = Default(ProfiledJSONResponse)
+        super().__init__(path, endpoint, **kwargs)
+        self.dependant.call = _profiled_endpoint(self.dependant.call)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def profiled_handler(request: Request):
+            profile = _current_profile.get()
+            if profile is None:
+                return await handler(request)
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                profile.route_seconds += time.perf_counter() - started
+
+        return profiled_handler
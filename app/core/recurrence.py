@@ -0,0 +1,169 @@
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import dropwhile, takewhile
+from typing import Iterator, Optional, Tuple
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    byday: Tuple[int, ...] = ()
+
+
+@lru_cache(maxsize=1024)
+def parse_rule(rule: str) -> RecurrenceRule:
+    """Parse an RRULE-style string, e.g. ``FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE``.
+
+    Supports FREQ, INTERVAL, COUNT, UNTIL and BYDAY (weekly rules only).
+    Raises ValueError on anything else.
+    """
+    if rule.upper().startswith("RRULE:"):
+        rule = rule[6:]
+    parts = {}
+    for part in rule.strip().split(";"):
+        if not part:
+            continue
+        key, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid recurrence rule part: {part}")
+        parts[key.strip().upper()] = value.strip().upper()
+
+    freq = parts.pop("FREQ", None)
+    if freq not in FREQUENCIES:
+        raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+
+    interval = int(parts.pop("INTERVAL", "1"))
+    if interval < 1:
+        raise ValueError("INTERVAL must be a positive integer")
+
+    count = parts.pop("COUNT", None)
+    count = int(count) if count is not None else None
+    if count is not None and count < 1:
+        raise ValueError("COUNT must be a positive integer")
+
+    until = parts.pop("UNTIL", None)
+    if until is not None:
+        until = datetime.strptime(
+            until.rstrip("Z"), "%Y%m%dT%H%M%S" if "T" in until else "%Y%m%d"
+        )
+
+    if count is not None and until is not None:
+        raise ValueError("COUNT and UNTIL cannot be used together")
+
+    byday = ()
+    if "BYDAY" in parts:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported for WEEKLY rules")
+        try:
+            byday = tuple(
+                sorted({WEEKDAYS.index(day) for day in parts.pop("BYDAY").split(",")})
+            )
+        except ValueError:
+            raise ValueError(f"BYDAY values must be in {', '.join(WEEKDAYS)}")
+
+    if parts:
+        raise ValueError(f"Unsupported recurrence rule parts: {', '.join(parts)}")
+
+    return RecurrenceRule(
+        freq=freq, interval=interval, count=count, until=until, byday=byday
+    )
+
+
+def _add_months(dt: datetime, months: int) -> Optional[datetime]:
+    month_index = dt.month - 1 + months
+    year, month = dt.year + month_index // 12, month_index % 12 + 1
+    if dt.day > calendar.monthrange(year, month)[1]:
+        # Igual que RFC 5545: las fechas inexistentes (31 de abril) se omiten
+        return None
+    return dt.replace(year=year, month=month)
+
+
+def _period_occurrences(
+    dtstart: datetime, rule: RecurrenceRule, period: int
+) -> Iterator[datetime]:
+    step = period * rule.interval
+    if rule.freq == "DAILY":
+        yield dtstart + timedelta(days=step)
+    elif rule.freq == "WEEKLY":
+        if not rule.byday:
+            yield dtstart + timedelta(weeks=step)
+            return
+        week_start = dtstart - timedelta(days=dtstart.weekday()) + timedelta(weeks=step)
+        for weekday in rule.byday:
+            occurrence = week_start + timedelta(days=weekday)
+            if occurrence >= dtstart:
+                yield occurrence
+    else:
+        occurrence = _add_months(dtstart, step * 12 if rule.freq == "YEARLY" else step)
+        if occurrence is not None:
+            yield occurrence
+
+
+def _first_period(dtstart: datetime, rule: RecurrenceRule, start: datetime) -> int:
+    # Sin COUNT se puede saltar directamente a los periodos cercanos a la
+    # ventana en lugar de recorrer toda la serie desde dtstart.
+    if rule.count is not None or start <= dtstart:
+        return 0
+    if rule.freq == "DAILY":
+        periods = (start - dtstart).days // rule.interval
+    elif rule.freq == "WEEKLY":
+        periods = (start - dtstart).days // 7 // rule.interval
+    elif rule.freq == "MONTHLY":
+        periods = (
+            (start.year - dtstart.year) * 12 + start.month - dtstart.month
+        ) // rule.interval
+    else:
+        periods = (start.year - dtstart.year) // rule.interval
+    return max(periods - 1, 0)
+
+
+def iter_occurrences(
+    dtstart: datetime, rule: RecurrenceRule, start: Optional[datetime] = None
+) -> Iterator[datetime]:
+    """Lazily yield occurrences in order, skipping ahead towards ``start``."""
+    produced = 0
+    period = _first_period(dtstart, rule, start) if start is not None else 0
+    while True:
+        for occurrence in _period_occurrences(dtstart, rule, period):
+            if rule.until is not None and occurrence > rule.until:
+                return
+            yield occurrence
+            produced += 1
+            if rule.count is not None and produced >= rule.count:
+                return
+        period += 1
+
+
+@lru_cache(maxsize=4096)
+def occurrences_between(
+    rule: str, dtstart: datetime, start: datetime, end: datetime
+) -> Tuple[datetime, ...]:
+    """Occurrences of ``rule`` in ``[start, end)``, cached per rule and window."""
+    occurrences = iter_occurrences(dtstart, parse_rule(rule), start)
+    return tuple(
+        takewhile(
+            lambda occurrence: occurrence < end,
+            dropwhile(lambda occurrence: occurrence < start, occurrences),
+        )
+    )
+
+
+def next_occurrence(
+    rule: str, dtstart: datetime, start: datetime, end: datetime
+) -> Optional[datetime]:
+    """First occurrence of ``rule`` in ``[start, end)``, or None."""
+    occurrences = iter_occurrences(dtstart, parse_rule(rule), start)
+    for occurrence in occurrences:
+        if occurrence >= end:
+            return None
+        if occurrence >= start:
+            return occurrence
+    return None
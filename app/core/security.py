@@ -1,3 +1,4 @@
+import logging
 from passlib.context import CryptContext
 from jose import jwt
 from datetime import datetime, timedelta
@@ -8,6 +9,8 @@ SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
+logger = logging.getLogger(__name__)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -39,11 +42,11 @@ def decode_access_token(token: str, verify_exp: bool = True):
             options={"verify_exp": verify_exp},
         )
     except jwt.ExpiredSignatureError:
-        print("Error: El token ha expirado")
+        logger.warning("El token ha expirado")
         raise Exception("El token ha expirado")
     except jwt.InvalidSignatureError:
-        print("Error: La firma del token es inválida (SECRET_KEY incorrecta)")
+        logger.warning("La firma del token es inválida (SECRET_KEY incorrecta)")
         raise Exception("Firma del token inválida")
     except jwt.JWTError as e:
-        print(f"Error decodificando token: {e}")
+        logger.warning(f"Error decodificando token: {e}")
         raise Exception(f"Error de validación de token: {e}")
@@ -0,0 +1,366 @@
+import asyncio
+import bisect
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.recurrence import next_occurrence
+from app.db.session import SessionLocal
+from app.models.events import Event
+from app.schemas.events import EventResponse, event_response
+
+logger = logging.getLogger(__name__)
+
+_Key = Tuple[datetime, int]
+
+
+@dataclass
+class _Entry:
+    event_id: int
+    category_id: Optional[int]
+    start: datetime
+    series: EventResponse
+    body: bytes
+
+    @property
+    def key(self) -> _Key:
+        return (self.start, self.event_id)
+
+
+def _entry_for(event: Event, now: datetime, horizon: datetime) -> Optional[_Entry]:
+    """Next occurrence of ``event`` in ``[now, horizon)`` with its JSON body."""
+    if event.deleted_at is not None:
+        return None
+    series = event_response(event)
+    return _occurrence_entry(event.id, event.category_id, series, now, horizon)
+
+
+def _occurrence_entry(
+    event_id: int,
+    category_id: Optional[int],
+    series: EventResponse,
+    now: datetime,
+    horizon: datetime,
+) -> Optional[_Entry]:
+    if not series.recurrence_rule:
+        if not now <= series.start_date < horizon:
+            return None
+        occurrence = series
+    else:
+        start = next_occurrence(series.recurrence_rule, series.start_date, now, horizon)
+        if start is None:
+            return None
+        shift = start - series.start_date
+        occurrence = series.model_copy(
+            update={
+                "start_date": start,
+                "end_date": series.end_date + shift,
+                "start_time": series.start_time + shift if series.start_time else None,
+            }
+        )
+    return _Entry(
+        event_id=event_id,
+        category_id=category_id,
+        start=occurrence.start_date,
+        series=series,
+        body=occurrence.model_dump_json().encode(),
+    )
+
+
+class _Head:
+    """First ``size`` upcoming occurrences of one scope, sorted by key.
+
+    Every occurrence up to the last key is present; when ``complete`` there
+    is nothing beyond it either, so any new occurrence belongs here.
+    """
+
+    def __init__(self, size: int, entries: List[_Entry], complete: bool):
+        self.size = size
+        self.complete = complete
+        self.entries = {entry.event_id: entry for entry in entries}
+        self.keys = sorted(entry.key for entry in entries)
+
+    def covers(self, key: _Key) -> bool:
+        return self.complete or (bool(self.keys) and key <= self.keys[-1])
+
+    def insert(self, entry: _Entry) -> None:
+        if not self.covers(entry.key):
+            return
+        self.entries[entry.event_id] = entry
+        bisect.insort(self.keys, entry.key)
+        if len(self.keys) > self.size:
+            _, event_id = self.keys.pop()
+            del self.entries[event_id]
+            # Lo que había detrás del descartado ya no se conoce
+            self.complete = False
+
+    def remove(self, event_id: int) -> Optional[_Entry]:
+        entry = self.entries.pop(event_id, None)
+        if entry is None:
+            return None
+        index = bisect.bisect_left(self.keys, entry.key)
+        if index < len(self.keys) and self.keys[index] == entry.key:
+            del self.keys[index]
+        return entry
+
+    def top(self, now: datetime, limit: int) -> Optional[List[bytes]]:
+        """Bodies of the next ``limit`` occurrences, or None if drained."""
+        # Las entradas ya empezadas que el tick aún no ha retirado se saltan
+        index = bisect.bisect_left(self.keys, (now, -1))
+        if len(self.keys) - index < limit and not self.complete:
+            return None
+        return [
+            self.entries[event_id].body
+            for _, event_id in self.keys[index : index + limit]
+        ]
+
+
+class UpcomingFeed:
+    """Materialized "next events from now", globally and per category.
+
+    Keeps a bounded head per scope (all events, and each category that has
+    been requested) with the next ``head_size`` occurrences sorted by
+    ``(start, event_id)`` and their response bodies already serialized.
+    A top-N read is a bisect plus a slice; a head that can no longer serve
+    a read is refilled from the database.
+
+    Write paths call ``refresh_event``; a clock tick drops started events,
+    moves recurring series to their next occurrence and refills heads that
+    ran low; a periodic reload of every head picks up writes from other
+    processes.
+    """
+
+    def __init__(
+        self,
+        horizon_days: int,
+        head_size: int,
+        tick_seconds: int,
+        reload_seconds: int,
+    ):
+        self.horizon_days = horizon_days
+        self.head_size = head_size
+        self.tick_seconds = tick_seconds
+        self.reload_seconds = reload_seconds
+        # Clave None: todos los eventos
+        self._heads: Dict[Optional[int], _Head] = {}
+        self._watchers: List[Set[int]] = []
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _horizon(self, now: datetime) -> datetime:
+        return now + timedelta(days=self.horizon_days)
+
+    def _select_head(
+        self, db: Session, scope: Optional[int], now: datetime, horizon: datetime
+    ) -> _Head:
+        single = (
+            select(Event.id, Event.start_date)
+            .where(
+                Event.recurrence_rule.is_(None),
+                Event.start_date >= now,
+                Event.start_date < horizon,
+            )
+            .order_by(Event.start_date, Event.id)
+            .limit(self.head_size)
+        )
+        series = select(Event.id, Event.start_date, Event.recurrence_rule).where(
+            Event.recurrence_rule.is_not(None), Event.start_date < horizon
+        )
+        if scope is not None:
+            single = single.where(Event.category_id == scope)
+            series = series.where(Event.category_id == scope)
+
+        single_keys = [(row.start_date, row.id) for row in db.execute(single)]
+        candidates = len(single_keys)
+
+        def series_keys():
+            nonlocal candidates
+            # Las series no se ordenan en SQL: solo se guarda su siguiente
+            # ocurrencia mientras nsmallest conserva las head_size primeras
+            for row in db.execute(series.execution_options(yield_per=1000)):
+                start = next_occurrence(row.recurrence_rule, row.start_date, now, horizon)
+                if start is not None:
+                    candidates += 1
+                    yield (start, row.id)
+
+        keys = heapq.nsmallest(
+            self.head_size, itertools.chain(single_keys, series_keys())
+        )
+        complete = len(single_keys) < self.head_size and candidates <= self.head_size
+
+        events = db.query(Event).filter(Event.id.in_([i for _, i in keys])).all()
+        entries = [
+            entry
+            for entry in (_entry_for(event, now, horizon) for event in events)
+            if entry is not None
+        ]
+        return _Head(self.head_size, entries, complete)
+
+    def _refill(self, scopes: List[Optional[int]], db: Optional[Session] = None) -> None:
+        session_created = False
+        if db is None:
+            db = SessionLocal()
+            session_created = True
+
+        touched: Set[int] = set()
+        with self._lock:
+            self._watchers.append(touched)
+        now = datetime.now()
+        horizon = self._horizon(now)
+        try:
+            heads = {scope: self._select_head(db, scope, now, horizon) for scope in scopes}
+        except Exception:
+            with self._lock:
+                self._watchers.remove(touched)
+            raise
+        finally:
+            if session_created:
+                db.close()
+
+        with self._lock:
+            self._heads.update(heads)
+            self._watchers.remove(touched)
+            size = sum(len(head.keys) for head in self._heads.values())
+        # Escrituras hechas durante la carga pueden no estar en la foto
+        for event_id in touched:
+            self.refresh_event(event_id)
+        metrics.incr("upcoming.refills", len(heads))
+        metrics.gauge("upcoming.entries", size)
+
+    def load(self, db: Optional[Session] = None) -> None:
+        """Reload the global head and every category head already in use."""
+        with self._lock:
+            scopes = [None] + [scope for scope in self._heads if scope is not None]
+        self._refill(scopes, db)
+        self._loaded_at = time.monotonic()
+        metrics.incr("upcoming.reloads")
+
+    def refresh_event(self, event_id: int, db: Optional[Session] = None) -> None:
+        """Re-read one event after a write and update its position.
+
+        Write paths pass their own session so a request never holds two
+        pooled connections at once.
+        """
+        if self._loaded_at is None and not self._watchers:
+            # Aún no cargado: la primera carga ya verá el cambio
+            return
+        session_created = False
+        if db is None:
+            db = SessionLocal()
+            session_created = True
+
+        now = datetime.now()
+        try:
+            event = db.query(Event).filter(Event.id == event_id).first()
+            entry = _entry_for(event, now, self._horizon(now)) if event else None
+        finally:
+            if session_created:
+                db.close()
+
+        with self._lock:
+            for touched in self._watchers:
+                touched.add(event_id)
+            # La categoría puede haber cambiado: se quita de todas las cabezas
+            for head in self._heads.values():
+                head.remove(event_id)
+            if entry is not None:
+                for scope in {None, entry.category_id}:
+                    head = self._heads.get(scope)
+                    if head is not None:
+                        head.insert(entry)
+
+    def tick(self) -> int:
+        """Drop started occurrences; recurring series move to the next one.
+
+        Heads left with less than half of ``head_size`` are refilled.
+        """
+        now = datetime.now()
+        horizon = self._horizon(now)
+        expired = 0
+        with self._lock:
+            for head in self._heads.values():
+                while head.keys and head.keys[0][0] < now:
+                    entry = head.remove(head.keys[0][1])
+                    if entry is None:
+                        del head.keys[0]
+                        continue
+                    expired += 1
+                    if entry.series.recurrence_rule:
+                        following = _occurrence_entry(
+                            entry.event_id, entry.category_id, entry.series, now, horizon
+                        )
+                        if following is not None:
+                            head.insert(following)
+            low = [
+                scope
+                for scope, head in self._heads.items()
+                if not head.complete and len(head.keys) < head.size // 2
+            ]
+        metrics.incr("upcoming.expired", expired)
+        if low:
+            self._refill(low)
+        return expired
+
+    def top(self, limit: int, category_id: Optional[int] = None) -> List[bytes]:
+        if self._loaded_at is None:
+            self.load()
+        now = datetime.now()
+        with self._lock:
+            head = self._heads.get(category_id)
+            bodies = head.top(now, limit) if head is not None else None
+        if bodies is not None:
+            return bodies
+        # Categoría aún no pedida o cabeza agotada: se rellena desde la base
+        self._refill([category_id])
+        with self._lock:
+            return self._heads[category_id].top(now, limit) or []
+
+    async def run(self) -> None:
+        # La primera vuelta carga de inmediato: la primera petición a
+        # /upcoming no debe pagar la carga completa
+        while True:
+            try:
+                if (
+                    self._loaded_at is None
+                    or time.monotonic() - self._loaded_at > self.reload_seconds
+                ):
+                    await asyncio.to_thread(self.load)
+                else:
+                    # El tick puede rellenar cabezas: consulta la base de datos
+                    await asyncio.to_thread(self.tick)
+            except Exception as e:
+                metrics.incr("upcoming.errors")
+                logger.error(f"Error refreshing upcoming events: {str(e)}")
+            await asyncio.sleep(self.tick_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+upcoming_feed = UpcomingFeed(
+    horizon_days=settings.upcoming_horizon_days,
+    head_size=max(settings.upcoming_head_size, settings.upcoming_max_limit),
+    tick_seconds=settings.upcoming_tick_seconds,
+    reload_seconds=settings.upcoming_reload_seconds,
+)
@@ -3,3 +3,6 @@ from app.db.base_class import Base
 from app.models.user import User
 from app.models.category import Category
 from app.models.events import Event
+from app.models.attendee import EventAttendee
+from app.models.event_archive import EventArchive, EventAttendeeArchive
+from app.models.event_tombstone import EventTombstone
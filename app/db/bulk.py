@@ -0,0 +1,74 @@
+import csv
+import io
+from datetime import date, datetime
+from typing import List
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.engine import Connection
+
+# Marcador de NULL para COPY: distingue NULL de la cadena vacía
+_COPY_NULL = "\\N"
+
+
+def _copy_value(value):
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _copy_rows(conn: Connection, table: Table, rows: List[dict]) -> None:
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row[column]) for column in columns])
+    buffer.seek(0)
+
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    # COPY va por la conexión DBAPI (psycopg2) dentro de la misma transacción
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f'COPY "{table.name}" ({column_list}) FROM STDIN '
+            f"WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def bulk_insert(conn: Connection, table: Table, rows: List[dict]) -> None:
+    """Insert ``rows`` (dicts with the same keys) into ``table``.
+
+    PostgreSQL with psycopg2 uses ``COPY ... FROM STDIN``; other backends
+    use a Core ``INSERT`` executemany. The caller owns the transaction.
+    """
+    if not rows:
+        return
+    if conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg2":
+        _copy_rows(conn, table, rows)
+    else:
+        conn.execute(insert(table), rows)
+
+
+def reset_sequence(conn: Connection, table: Table, *also: Table) -> None:
+    """Move a PostgreSQL serial sequence past the highest id in ``table``.
+
+    Needed after loading rows with explicit ids (COPY or INSERT). Ids in the
+    ``also`` tables (e.g. an archive that keeps the original ids) are taken
+    into account too, so they are never handed out again.
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    highest = ", ".join(
+        f'COALESCE((SELECT MAX(id) FROM "{t.name}"), 0)' for t in (table, *also)
+    )
+    conn.execute(
+        text(
+            "SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+            f"GREATEST({highest}) + 1, false)"
+        ),
+        {"table": table.name},
+    )
@@ -0,0 +1,13 @@
+import os
+import sqlite3
+
+
+def open_local_db(path: str) -> sqlite3.Connection:
+    """Open a process-local SQLite file used for auxiliary stores (outbox, etc.)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
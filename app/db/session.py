@@ -1,6 +1,41 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker, with_loader_criteria
 from app.core.config import settings
+from app.models import Event
 
-engine = create_engine(settings.database_url)
+
+def _create_engine():
+    url = make_url(settings.database_url)
+    if url.get_backend_name() == "sqlite":
+        # SQLite en archivo: SQLAlchemy ya usa un pool con check_same_thread=False
+        return create_engine(url)
+    return create_engine(
+        url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=True,
+    )
+
+
+engine = _create_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _exclude_soft_deleted_events(execute_state):
+    # Todas las lecturas ORM ocultan los eventos con soft delete, incluidas las
+    # relaciones (p. ej. Category.events). Usar
+    # execution_options(include_deleted=True) para verlos.
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                Event, Event.deleted_at.is_(None), include_aliases=True
+            )
+        )
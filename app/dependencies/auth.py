@@ -1,6 +1,7 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from app.core.cache import user_cache
 from app.core.security import decode_access_token
 from app.db.session import SessionLocal
 from app.models.user import User as DBUser
@@ -27,8 +28,23 @@ def get_current_user(
         # Muestra el error específico en la respuesta HTTP
         raise HTTPException(status_code=401, detail=f"Token inválido: {str(e)}")
 
-    user = db.query(DBUser).filter(DBUser.id == user_id).first()
-    if not user:
+    def load():
+        user = db.query(DBUser).filter(DBUser.id == user_id).first()
+        if not user:
+            return None
+        # El hash de la contraseña nunca va a la caché: la L2 es compartida
+        return {
+            "id": user.id,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "username": user.username,
+            "email": user.email,
+            "is_active": user.is_active,
+        }
+
+    data = user_cache.get_or_load(str(user_id), load)
+    if data is None:
         raise HTTPException(status_code=404, detail="Usuario no encontrado")
 
-    return user
+    # Instancia transitoria sin contraseña: no está asociada a la sesión
+    return DBUser(**data)
@@ -1,7 +1,12 @@
 # Define los modelos que se exportan desde este paquete
-__all__ = ['User', 'Category', 'Event']
+__all__ = [
+    'User', 'Category', 'Event', 'EventAttendee', 'EventArchive',
+    'EventAttendeeArchive'
+]
 
 # Importa todos los modelos para que SQLAlchemy los inicialice correctamente
 from app.models.user import User
 from app.models.category import Category
 from app.models.events import Event
+from app.models.attendee import EventAttendee
+from app.models.event_archive import EventArchive, EventAttendeeArchive
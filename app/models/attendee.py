@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
+from app.db.base_class import Base
+
+
+class EventAttendee(Base):
+    __tablename__ = "event_attendees"
+    __table_args__ = (
+        Index(
+            "ix_event_attendees_event_id_user_id", "event_id", "user_id", unique=True
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.now)
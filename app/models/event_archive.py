@@ -0,0 +1,42 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+from app.db.base_class import Base
+
+
+class EventArchive(Base):
+    """Finished events moved out of ``events`` by the archiver.
+
+    Same columns as ``events`` (the id is preserved) plus ``archived_at``;
+    only non-recurring, non-deleted events are archived.
+    """
+
+    __tablename__ = "events_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String)
+    description = Column(String)
+    start_date = Column(DateTime, index=True)
+    end_date = Column(DateTime)
+    start_time = Column(DateTime)
+    prize = Column(String)
+    location = Column(String)
+    category_id = Column(Integer, ForeignKey("categories.id"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    recurrence_rule = Column(String, nullable=True)
+    capacity = Column(Integer, nullable=True)
+    seats_available = Column(Integer, nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, nullable=False)
+    user = relationship("User", lazy="joined")
+
+
+class EventAttendeeArchive(Base):
+    __tablename__ = "event_attendees_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    event_id = Column(
+        Integer, ForeignKey("events_archive.id"), nullable=False, index=True
+    )
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, Integer
+from app.db.base_class import Base
+
+
+class EventTombstone(Base):
+    """Ids of soft-deleted events removed by the purger.
+
+    Delta syncs (``GET /events?updated_since=``) report these as removed
+    for ``PURGE_TOMBSTONE_RETENTION_DAYS`` after the purge.
+    """
+
+    __tablename__ = "event_tombstones"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    deleted_at = Column(DateTime, nullable=False, index=True)
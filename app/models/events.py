@@ -1,20 +1,49 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index(
+            "ix_events_category_id_start_date",
+            "category_id",
+            "start_date",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # El archivo conserva los ids: SQLite no debe reutilizar el más alto
+        {"sqlite_autoincrement": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String)
     description = Column(String)
     start_date = Column(DateTime)
-    end_date = Column(DateTime)
+    end_date = Column(DateTime, index=True)
     start_time = Column(DateTime)
     prize = Column(String)
     location = Column(String)
     category_id = Column(Integer, ForeignKey("categories.id"))
-    user_id = Column(Integer, ForeignKey("users.id"))
-    category = relationship("Category", back_populates="events", lazy="joined")
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    # Regla estilo RRULE (FREQ=WEEKLY;BYDAY=MO); una fila representa toda la serie
+    recurrence_rule = Column(String, nullable=True)
+    # capacity NULL = sin límite; seats_available se decrementa de forma atómica
+    capacity = Column(Integer, nullable=True)
+    seats_available = Column(Integer, nullable=True)
+    # Soft delete: las filas con deleted_at se ocultan de las lecturas y el
+    # purgador en segundo plano las elimina definitivamente por lotes.
+    deleted_at = Column(DateTime, nullable=True, index=True)
+    # Se actualiza en cada escritura (también en UPDATE de Core); permite
+    # respuestas delta con ?updated_since=
+    updated_at = Column(
+        DateTime, default=datetime.now, onupdate=datetime.now, index=True
+    )
+    # Control de concurrencia optimista: se incrementa en cada actualización
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # La categoría embebida en las respuestas sale de category_cache, sin JOIN
+    category = relationship("Category", back_populates="events", lazy="select")
     user = relationship("User", back_populates="events", lazy="joined")
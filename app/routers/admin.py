@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.core.profiling import profile_store, require_admin
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles", summary="Slowest profiled requests")
+def list_profiles():
+    return profile_store.list()
+
+
+@router.get("/profiles/{profile_id}", summary="Profiled request with cProfile stats")
+def get_profile(profile_id: int):
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile with id {profile_id} not found",
+        )
+    return profile
+
+
+@router.delete("/profiles", summary="Discard captured profiles")
+def clear_profiles():
+    profile_store.clear()
+    return {"message": "Profiles cleared successfully"}
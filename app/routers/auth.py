@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from app.db.session import SessionLocal
 from app.models.user import User as DBUser
 from app.schemas.user import User, UserCreate
 from app.core.security import hash_password, verify_password, create_access_token
+from app.core.idempotency import idempotency_store, request_fingerprint
+from app.core.cache import user_cache
+from app.tasks.queue import job_queue
 
 router = APIRouter()
 
@@ -18,23 +22,52 @@ def get_db():
 
 
 @router.post("/register", response_model=User)
-def register(user: UserCreate, db: Session = Depends(get_db)):
-    existing = db.query(DBUser).filter(DBUser.email == user.email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email ya registrado")
-
-    db_user = DBUser(
-        username=user.username,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        password=hash_password(user.password),
-        is_active=user.is_active,
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+def register(
+    user: UserCreate,
+    idempotency_key: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    scope = None
+    if idempotency_key:
+        # Un reintento devuelve la respuesta guardada sin consultar la base de
+        # datos ni volver a ejecutar bcrypt.
+        scope = f"register:{idempotency_key}"
+        fingerprint = request_fingerprint("POST /auth/register", user.model_dump_json())
+        stored = idempotency_store.begin(scope, fingerprint)
+        if stored is not None:
+            return stored.to_response()
+
+    try:
+        existing = db.query(DBUser).filter(DBUser.email == user.email).first()
+        if existing:
+            raise HTTPException(status_code=400, detail="Email ya registrado")
+
+        db_user = DBUser(
+            username=user.username,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            password=hash_password(user.password),
+            is_active=user.is_active,
+        )
+        db.add(db_user)
+        db.commit()
+        db.refresh(db_user)
+        # Descarta una posible entrada negativa para este id
+        user_cache.delete(str(db_user.id))
+        job_queue.enqueue("user.registered", {"user_id": db_user.id})
+
+        if scope:
+            idempotency_store.complete(
+                scope,
+                fingerprint,
+                status.HTTP_200_OK,
+                User.model_validate(db_user).model_dump_json().encode(),
+            )
+        return db_user
+    finally:
+        if scope:
+            idempotency_store.release(scope)
 
 
 @router.post("/login")
@@ -1,12 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from app.core.category_cache import category_cache
+from app.core.config import settings
+from app.core.ical import (
+    CALENDAR_FOOTER,
+    calendar_feed_cache,
+    calendar_header,
+    etag_for,
+    vevent,
+)
+from app.core.profiling import ProfiledRoute
 from app.models.category import Category as CategoryModel
+from app.models.events import Event as EventModel
 from app.schemas.category import Category
 from app.dependencies.auth import get_current_user
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, noload, with_parent
 from app.db.session import SessionLocal
 from app.models.user import User
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
+logger = logging.getLogger(__name__)
+
+ICS_MEDIA_TYPE = "text/calendar"
 
 
 def get_db():
@@ -18,15 +38,109 @@ def get_db():
 
 
 @router.get("/", response_model=list[Category])
-def get_categories(
+def get_categories():
+    try:
+        return category_cache.all()
+    except Exception:
+        logger.exception("Error getting categories")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get categories",
+        )
+
+
+def _not_modified(feed, if_none_match: Optional[str], if_modified_since: Optional[str]):
+    if if_none_match is not None:
+        return feed.etag in [tag.strip() for tag in if_none_match.split(",")]
+    if if_modified_since is not None:
+        try:
+            return feed.last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _category_events_query(db: Session, category_id: int):
+    category = db.get(CategoryModel, category_id)
+    return (
+        db.query(EventModel)
+        .filter(with_parent(category, CategoryModel.events))
+        .options(noload(EventModel.user))
+    )
+
+
+def _stream_feed(db: Session, category_id: int, header: str, generation: int):
+    # Primera generación: se envía a medida que se produce y al terminar se
+    # guarda en la caché, salvo que hubiera escrituras mientras tanto.
+    components = {}
+    yield header
+    query = _category_events_query(db, category_id).yield_per(
+        settings.ics_stream_chunk_size
+    )
+    for event in query:
+        component = vevent(event)
+        components[event.id] = component
+        yield component
+    yield CALENDAR_FOOTER
+    calendar_feed_cache.store(category_id, header, components, generation)
+
+
+@router.get("/{category_id}/events.ics", summary="Calendar feed of a category")
+def get_category_calendar(
+    category_id: int,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     try:
-        categories = db.query(CategoryModel).all()
-        return categories
-    except Exception as e:
-        print(f"Error getting categories: {str(e)}")
+        category = category_cache.get(category_id)
+        if category is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Category with id {category_id} not found",
+            )
+
+        feed = calendar_feed_cache.get(category_id)
+        if feed is None:
+            generation = calendar_feed_cache.generation(category_id)
+            headers = {
+                "ETag": etag_for(generation),
+                "Last-Modified": format_datetime(
+                    datetime.now(timezone.utc), usegmt=True
+                ),
+            }
+            return StreamingResponse(
+                _stream_feed(
+                    db, category_id, calendar_header(category.name), generation
+                ),
+                media_type=ICS_MEDIA_TYPE,
+                headers=headers,
+            )
+
+        headers = {
+            "ETag": feed.etag,
+            "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+        }
+        if _not_modified(feed, if_none_match, if_modified_since):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        dirty, generation = calendar_feed_cache.dirty_ids(feed)
+        if dirty:
+            events = (
+                _category_events_query(db, category_id)
+                .filter(EventModel.id.in_(dirty))
+                .all()
+            )
+            calendar_feed_cache.apply(category_id, feed, dirty, generation, events)
+
+        return Response(
+            content=feed.render(), media_type=ICS_MEDIA_TYPE, headers=headers
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error getting category calendar")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get categories",
+            detail="Failed to get category calendar",
         )
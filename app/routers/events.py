@@ -1,16 +1,52 @@
-from app.models.category import Category
+import logging
+from app.core.cache import event_cache
+from app.core.category_cache import category_cache
+from app.core.compact import JSON_MEDIA_TYPE, encode, negotiate
+from app.core.config import settings
+from app.core.dataloader import DataLoader
+from app.core.ical import calendar_feed_cache
+from app.core.idempotency import idempotency_store, request_fingerprint
+from app.core.profiling import ProfiledRoute
+from app.core.upcoming import upcoming_feed
 from app.models.events import Event as EventModel
-from app.schemas.events import Event, EventResponse, EventCreate, EventUpdate
-from fastapi import APIRouter, Depends, HTTPException, status
+from app.models.attendee import EventAttendee
+from app.models.event_archive import EventArchive
+from app.models.event_tombstone import EventTombstone
+from app.schemas.events import (
+    Event,
+    EventResponse,
+    EventCreate,
+    EventUpdate,
+    EventPatch,
+    Registration,
+    EventBatchRequest,
+    EventBatchResponse,
+    event_response,
+)
+from app.schemas.query import EventField, UserField
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.dependencies.auth import get_current_user
 from app.models.user import User
+from app.core.recurrence import occurrences_between
+from app.tasks.queue import job_queue
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, get_args
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
+logger = logging.getLogger(__name__)
 
 
 def get_db():
@@ -21,39 +57,117 @@ def get_db():
         db.close()
 
 
+def _invalidate_event(db: Session, event_id: int, category_id: Optional[int]):
+    event_cache.delete(str(event_id))
+    # Sin category_id el feed solo sabría la categoría si ya lo sirvió
+    calendar_feed_cache.invalidate_event(event_id, category_id)
+    # Con la sesión de la petición: abrir otra mientras esta retiene su
+    # conexión puede agotar el pool con muchas escrituras concurrentes
+    upcoming_feed.refresh_event(event_id, db)
+
+
+def _notify_event_written(
+    db: Session, action: str, event_id: int, category_id: Optional[int] = None
+):
+    _invalidate_event(db, event_id, category_id)
+    # El resto de efectos secundarios se ejecutan fuera de la respuesta
+    job_queue.enqueue(
+        f"event.{action}", {"event_id": event_id, "category_id": category_id}
+    )
+
+
+def _ensure_category_exists(category_id: int):
+    if category_cache.get(category_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Category with id {category_id} not found",
+        )
+
+
 @router.post("/", response_model=Event, status_code=status.HTTP_201_CREATED)
 def create_event(
     event_create: EventCreate,
+    idempotency_key: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
+    scope = None
+    if idempotency_key:
+        # Se reserva fuera del try: si otra petición tiene la clave (409),
+        # el finally no debe liberar una reserva que no es nuestra
+        scope = f"events:{current_user.id}:{idempotency_key}"
+        fingerprint = request_fingerprint(
+            "POST /events", event_create.model_dump_json()
+        )
+        stored = idempotency_store.begin(scope, fingerprint)
+        if stored is not None:
+            return stored.to_response()
+
     try:
-        category_id = event_create.category_id
-        category = db.query(Category).filter(Category.id == category_id).first()
-        if not category:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Category with id {category_id} not found",
-            )
+        _ensure_category_exists(event_create.category_id)
 
         event_data = event_create.model_dump()
         event_data["user_id"] = current_user.id
+        event_data["seats_available"] = event_create.capacity
         new_event = EventModel(**event_data)
 
         db.add(new_event)
         db.commit()
         db.refresh(new_event)
+        _notify_event_written(db, "created", new_event.id, new_event.category_id)
+
+        if scope:
+            idempotency_store.complete(
+                scope,
+                fingerprint,
+                status.HTTP_201_CREATED,
+                Event.model_validate(new_event).model_dump_json().encode(),
+            )
 
         return new_event
     except HTTPException as e:
         raise e
-    except Exception as e:
+    except Exception:
         db.rollback()
-        print(f"Error creating event: {str(e)}")
+        logger.exception("Error creating event")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create event",
         )
+    finally:
+        if scope:
+            idempotency_store.release(scope)
+
+
+def _occurrence_shifts(events, window_start: datetime, window_end: datetime):
+    """Yield ``(event, shift)`` per occurrence; ``shift`` is None for single events."""
+    for event in events:
+        if not event.recurrence_rule:
+            yield event, None
+            continue
+
+        for occurrence in occurrences_between(
+            event.recurrence_rule, event.start_date, window_start, window_end
+        ):
+            yield event, occurrence - event.start_date
+
+
+def _shifted_dates(event, shift: timedelta) -> dict:
+    return {
+        "start_date": event.start_date + shift,
+        "end_date": event.end_date + shift,
+        "start_time": event.start_time + shift if event.start_time else None,
+    }
+
+
+def _expand_occurrences(events, window_start: datetime, window_end: datetime):
+    last = series = None
+    for event, shift in _occurrence_shifts(events, window_start, window_end):
+        if event is not last:
+            last, series = event, event_response(event)
+        yield series if shift is None else series.model_copy(
+            update=_shifted_dates(event, shift)
+        )
 
 
 class TimeFilter(str, Enum):
@@ -63,30 +177,156 @@ class TimeFilter(str, Enum):
     year = "year"
 
 
+def _filter_events(
+    query,
+    model,
+    category_id: Optional[int],
+    window,
+    updated_since: Optional[datetime] = None,
+):
+    if category_id is not None:
+        query = query.filter(model.category_id == category_id)
+    if updated_since is not None:
+        query = query.filter(model.updated_at >= updated_since)
+    if window is None:
+        return query.all()
+
+    window_start, window_end = window
+    # Las series recurrentes se guardan en una sola fila; cualquier serie que
+    # empiece antes del fin de la ventana puede tener ocurrencias dentro.
+    return query.filter(
+        or_(
+            and_(
+                model.recurrence_rule.is_(None),
+                model.start_date >= window_start,
+                model.start_date < window_end,
+            ),
+            and_(
+                model.recurrence_rule.is_not(None),
+                model.start_date < window_end,
+            ),
+        )
+    ).all()
+
+
+def _removed_since(
+    db: Session, since: datetime, returned_ids: set, include_archived: bool
+) -> List[int]:
+    # Ids tocados desde ``since`` que ya no salen en la respuesta: borrados,
+    # archivados o que dejaron de cumplir el filtro. El cliente descarta los
+    # que tenga y el resto los ignora.
+    changed = (
+        db.query(EventModel.id)
+        .execution_options(include_deleted=True)
+        .filter(EventModel.updated_at >= since)
+        .all()
+    )
+    removed = {row.id for row in changed}
+    # Los ya purgados solo quedan como lápida
+    purged = (
+        db.query(EventTombstone.id).filter(EventTombstone.deleted_at >= since).all()
+    )
+    removed.update(row.id for row in purged)
+    if not include_archived:
+        archived = (
+            db.query(EventArchive.id).filter(EventArchive.archived_at >= since).all()
+        )
+        removed.update(row.id for row in archived)
+    return sorted(removed - returned_ids)
+
+
+_COMPACT_EVENT_FIELDS = get_args(EventField) + ("updated_at",)
+_COMPACT_USER_FIELDS = get_args(UserField)
+
+
+def _normalized_payload(db: Session, occurrences) -> dict:
+    # Cada evento lleva solo category_id y user_id; categorías y usuarios se
+    # envían una vez en mapas por id en lugar de repetirse en cada fila
+    events = []
+    for event, shift in occurrences:
+        row = {field: getattr(event, field) for field in _COMPACT_EVENT_FIELDS}
+        if shift is not None:
+            row.update(_shifted_dates(event, shift))
+        # Los campos nulos se omiten: un campo ausente equivale a null
+        events.append({key: value for key, value in row.items() if value is not None})
+
+    categories = DataLoader(
+        category_cache.get_many,
+        chunk_size=settings.query_in_chunk_size,
+        name="categories",
+    ).load_many(row["category_id"] for row in events)
+    users = DataLoader(
+        lambda ids: {
+            row.id: row
+            for row in db.execute(
+                select(*[User.__table__.c[field] for field in _COMPACT_USER_FIELDS])
+                .where(User.id.in_(ids))
+            ).all()
+        },
+        chunk_size=settings.query_in_chunk_size,
+        name="users",
+    ).load_many(row["user_id"] for row in events)
+
+    return {
+        "events": events,
+        "categories": {
+            category_id: category.model_dump()
+            for category_id, category in categories.items()
+            if category is not None
+        },
+        "users": {
+            user_id: dict(user._mapping)
+            for user_id, user in users.items()
+            if user is not None
+        },
+    }
+
+
 @router.get("/", response_model=list[EventResponse])
 def get_events(
+    response: Response,
     category_id: Optional[int] = None,
     time_filter: Optional[TimeFilter] = None,
     date: Optional[str] = None,
+    include_archived: bool = False,
+    updated_since: Optional[datetime] = None,
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
+    """List events.
 
+    ``Accept`` selects the format: plain JSON (default), normalized JSON
+    (``application/vnd.imagineapps.normalized+json``) or MessagePack, both
+    with categories and users side-loaded by id. With ``updated_since`` only
+    events changed since then are returned, plus the ids to drop and the
+    ``server_time`` to send on the next sync. ``server_time`` lags the clock
+    by ``EVENTS_DELTA_OVERLAP_SECONDS``, so consecutive deltas overlap and
+    clients must merge by id.
+    """
     try:
-        query = db.query(EventModel)
+        media_type = negotiate(accept)
+        response.headers["Vary"] = "Accept"
 
-        if category_id is not None:
-            query = query.filter(EventModel.category_id == category_id)
+        server_time = datetime.now()
+        if updated_since is not None:
+            if updated_since.tzinfo is not None:
+                updated_since = updated_since.astimezone().replace(tzinfo=None)
+            # Las lápidas de los purgados caducan: más atrás ya no se puede
+            # saber qué desapareció y hace falta una carga completa
+            oldest = server_time - timedelta(days=settings.purge_tombstone_retention_days)
+            if updated_since < oldest:
+                raise HTTPException(
+                    status_code=status.HTTP_410_GONE,
+                    detail="updated_since is too old; fetch the full list again",
+                )
 
+        window = None
         if date is not None:
             try:
                 specific_date = datetime.strptime(date, "%Y-%m-%d").replace(
                     hour=0, minute=0, second=0, microsecond=0
                 )
-                next_day = specific_date + timedelta(days=1)
-                query = query.filter(
-                    EventModel.start_date >= specific_date,
-                    EventModel.start_date < next_day,
-                )
+                window = (specific_date, specific_date + timedelta(days=1))
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -97,16 +337,10 @@ def get_events(
             today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
             if time_filter == TimeFilter.today:
-                tomorrow = today + timedelta(days=1)
-                query = query.filter(
-                    EventModel.start_date >= today, EventModel.start_date < tomorrow
-                )
+                window = (today, today + timedelta(days=1))
             elif time_filter == TimeFilter.week:
                 monday = today - timedelta(days=today.weekday())
-                next_monday = monday + timedelta(days=7)
-                query = query.filter(
-                    EventModel.start_date >= monday, EventModel.start_date < next_monday
-                )
+                window = (monday, monday + timedelta(days=7))
             elif time_filter == TimeFilter.month:
                 start_of_month = today.replace(day=1)
                 if today.month == 12:
@@ -115,22 +349,138 @@ def get_events(
                     )
                 else:
                     start_of_next_month = today.replace(month=today.month + 1, day=1)
-                query = query.filter(
-                    EventModel.start_date >= start_of_month,
-                    EventModel.start_date < start_of_next_month,
-                )
+                window = (start_of_month, start_of_next_month)
             elif time_filter == TimeFilter.year:
                 start_of_year = today.replace(month=1, day=1)
                 start_of_next_year = today.replace(year=today.year + 1, month=1, day=1)
-                query = query.filter(
-                    EventModel.start_date >= start_of_year,
-                    EventModel.start_date < start_of_next_year,
+                window = (start_of_year, start_of_next_year)
+
+        # Por defecto solo se consulta la tabla caliente; el histórico
+        # archivado se añade cuando se pide explícitamente
+        models = [EventModel, EventArchive] if include_archived else [EventModel]
+        events = []
+        for model in models:
+            events.extend(
+                _filter_events(
+                    db.query(model), model, category_id, window, updated_since
                 )
+            )
+
+        if media_type == JSON_MEDIA_TYPE and updated_since is None:
+            if window is None:
+                return [event_response(event) for event in events]
+            return list(_expand_occurrences(events, *window))
 
-        events = query.all()
-        return events
-    except Exception as e:
-        print(f"Error getting events: {str(e)}")
+        if media_type == JSON_MEDIA_TYPE:
+            responses = (
+                _expand_occurrences(events, *window)
+                if window
+                else map(event_response, events)
+            )
+            payload = {"events": [item.model_dump(mode="json") for item in responses]}
+        else:
+            payload = _normalized_payload(
+                db,
+                _occurrence_shifts(events, *window)
+                if window
+                else ((event, None) for event in events),
+            )
+        if updated_since is not None:
+            returned_ids = {event.id for event in events}
+            payload["removed"] = _removed_since(
+                db, updated_since, returned_ids, include_archived
+            )
+            # updated_at se fija en el flush, antes del COMMIT: una escritura
+            # aún sin confirmar puede tener un updated_at anterior a server_time
+            payload["server_time"] = server_time - timedelta(
+                seconds=settings.events_delta_overlap_seconds
+            )
+        return encode(payload, media_type)
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error getting events")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get events",
+        )
+
+
+@router.get(
+    "/upcoming",
+    response_model=list[EventResponse],
+    summary="Next events from now",
+)
+def get_upcoming_events(
+    category_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=settings.upcoming_max_limit),
+):
+    try:
+        # Los cuerpos ya están serializados: se sirven sin tocar la base de datos
+        bodies = upcoming_feed.top(limit, category_id)
+        return Response(
+            content=b"[" + b",".join(bodies) + b"]",
+            media_type="application/json",
+        )
+    except Exception:
+        logger.exception("Error getting upcoming events")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get upcoming events",
+        )
+
+
+def _get_events_by_ids(db: Session, ids: List[int]) -> EventBatchResponse:
+    unique_ids = list(dict.fromkeys(ids))
+    if len(unique_ids) > settings.events_batch_max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.events_batch_max_ids} ids per batch",
+        )
+
+    events = db.query(EventModel).filter(EventModel.id.in_(unique_ids)).all()
+    by_id = {event.id: event for event in events}
+    return EventBatchResponse(
+        events=[event_response(by_id[i]) for i in unique_ids if i in by_id],
+        missing=[i for i in unique_ids if i not in by_id],
+    )
+
+
+@router.get("/batch", response_model=EventBatchResponse)
+def get_events_batch(
+    ids: str,
+    db: Session = Depends(get_db),
+):
+    try:
+        try:
+            event_ids = [int(i) for i in ids.split(",") if i.strip()]
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="ids must be a comma separated list of integers",
+            )
+        return _get_events_by_ids(db, event_ids)
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error getting events batch")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get events",
+        )
+
+
+@router.post("/batch", response_model=EventBatchResponse)
+def post_events_batch(
+    batch: EventBatchRequest,
+    db: Session = Depends(get_db),
+):
+    try:
+        return _get_events_by_ids(db, batch.ids)
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error getting events batch")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get events",
@@ -140,61 +490,190 @@ def get_events(
 @router.get("/{event_id}", response_model=EventResponse)
 def get_event(
     event_id: int,
+    response: Response,
     db: Session = Depends(get_db),
 ):
-    try:
+    def load():
         event = db.query(EventModel).filter(EventModel.id == event_id).first()
         if not event:
+            return None
+        return event_response(event).model_dump(mode="json")
+
+    try:
+        # Lectura a través de la caché (L1 en proceso, L2 compartida);
+        # los eventos inexistentes también se cachean durante unos segundos
+        data = event_cache.get_or_load(str(event_id), load)
+        if data is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Event with id {event_id} not found",
             )
-        return event
+        response.headers["ETag"] = f'"{data["version"]}"'
+        return data
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Error getting event: {str(e)}")
+    except Exception:
+        logger.exception("Error getting event")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get event",
         )
 
 
+def _parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid If-Match header",
+        )
+
+
+def _attendee_count():
+    return (
+        select(func.count())
+        .select_from(EventAttendee)
+        .where(EventAttendee.event_id == EventModel.__table__.c.id)
+        .scalar_subquery()
+    )
+
+
+def _seats_for_capacity(capacity: Optional[int]):
+    if capacity is None:
+        return None
+    return capacity - _attendee_count()
+
+
+def _conditional_update(
+    db: Session,
+    event_id: int,
+    user_id: int,
+    values: dict,
+    expected_version: Optional[int],
+):
+    # Un solo UPDATE ... WHERE version = ? RETURNING en lugar de leer, modificar
+    # y refrescar la fila; si otra escritura ganó, no se actualiza nada.
+    table = EventModel.__table__
+    conditions = [
+        table.c.id == event_id,
+        table.c.user_id == user_id,
+        table.c.deleted_at.is_(None),
+    ]
+    if expected_version is not None:
+        conditions.append(table.c.version == expected_version)
+    if "category_id" in values:
+        _ensure_category_exists(values["category_id"])
+    capacity = values.get("capacity")
+    if "capacity" in values:
+        # En READ COMMITTED la subconsulta de asistentes usa la foto inicial
+        # del UPDATE aunque este espere el lock de una inscripción: se toma
+        # el lock antes para que el UPDATE vea a los ya inscritos
+        db.execute(select(table.c.id).where(table.c.id == event_id).with_for_update())
+        values["seats_available"] = _seats_for_capacity(capacity)
+    if capacity is not None:
+        # La capacidad no puede quedar por debajo de los asistentes ya inscritos
+        conditions.append(_attendee_count() <= capacity)
+
+    row = (
+        db.execute(
+            update(table)
+            .where(*conditions)
+            .values(**values, version=table.c.version + 1)
+            .returning(*table.c)
+        )
+        .mappings()
+        .first()
+    )
+    if row is None:
+        db.rollback()
+        current = (
+            db.query(EventModel.version, _attendee_count().label("attendees"))
+            .filter(EventModel.id == event_id, EventModel.user_id == user_id)
+            .first()
+        )
+        if current and expected_version not in (None, current.version):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail=f"Event with id {event_id} was modified by another request",
+            )
+        if current and capacity is not None and current.attendees > capacity:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Capacity {capacity} is below the "
+                f"{current.attendees} current attendees",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with id {event_id} not found",
+        )
+    db.commit()
+    _notify_event_written(db, "updated", row["id"], row["category_id"])
+    return row
+
+
 @router.put("/{event_id}", response_model=Event, summary="Update an event")
 def update_event(
     event_id: int,
     event_update: EventUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
 
     try:
-        event = (
-            db.query(EventModel)
-            .filter(
-                EventModel.id == event_id,
-                EventModel.user_id == current_user.id,
-            )
-            .first()
+        row = _conditional_update(
+            db,
+            event_id,
+            current_user.id,
+            # El propietario no cambia: user_id se ignora, igual que al crear
+            event_update.model_dump(exclude_unset=True, exclude={"user_id"}),
+            _parse_if_match(if_match),
         )
-        if not event:
+        response.headers["ETag"] = f'"{row["version"]}"'
+        return row
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error updating event")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update event",
+        )
+
+
+@router.patch("/{event_id}", response_model=Event, summary="Partially update an event")
+def patch_event(
+    event_id: int,
+    event_patch: EventPatch,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+
+    try:
+        values = event_patch.model_dump(exclude_unset=True)
+        if not values:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Event with id {event_id} not found",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No fields to update",
             )
-
-        update_data = event_update.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(event, key, value)
-        db.commit()
-        db.refresh(event)
-        return event
+        row = _conditional_update(
+            db, event_id, current_user.id, values, _parse_if_match(if_match)
+        )
+        response.headers["ETag"] = f'"{row["version"]}"'
+        return row
     except HTTPException:
         raise
-    except Exception as e:
-        import logging
-
-        logging.error(f"Error updating event: {str(e)}")
+    except Exception:
+        logger.exception("Error patching event")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update event",
@@ -208,29 +687,144 @@ def delete_event(
     current_user: User = Depends(get_current_user),
 ):
     try:
-        event = (
-            db.query(EventModel)
-            .filter(
-                EventModel.id == event_id,
-                EventModel.user_id == current_user.id,
+        table = EventModel.__table__
+        deleted = db.execute(
+            update(table)
+            .where(
+                table.c.id == event_id,
+                table.c.user_id == current_user.id,
+                table.c.deleted_at.is_(None),
             )
-            .first()
-        )
-        if not event:
+            .values(deleted_at=datetime.now())
+            .returning(table.c.category_id)
+        ).first()
+        if deleted is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Event with id {event_id} not found",
             )
-        db.delete(event)
         db.commit()
+        _notify_event_written(db, "deleted", event_id, deleted.category_id)
         return {"message": "Event deleted successfully"}
     except HTTPException:
         raise
-    except Exception as e:
-        import logging
-
-        logging.error(f"Error deleting event: {str(e)}")
+    except Exception:
+        logger.exception("Error deleting event")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete event",
         )
+
+
+@router.post(
+    "/{event_id}/register",
+    response_model=Registration,
+    status_code=status.HTTP_201_CREATED,
+    summary="Register to an event",
+)
+def register_to_event(
+    event_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        # Decremento condicional atómico: nunca se venden más plazas que las
+        # disponibles, aunque muchos usuarios se registren a la vez.
+        table = EventModel.__table__
+        row = db.execute(
+            update(table)
+            .where(
+                table.c.id == event_id,
+                table.c.deleted_at.is_(None),
+                or_(table.c.seats_available.is_(None), table.c.seats_available > 0),
+            )
+            .values(
+                seats_available=table.c.seats_available - 1,
+                version=table.c.version + 1,
+            )
+            .returning(table.c.seats_available, table.c.category_id)
+        ).first()
+        if row is None:
+            db.rollback()
+            if not db.query(EventModel.id).filter(EventModel.id == event_id).first():
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Event with id {event_id} not found",
+                )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Event with id {event_id} is full",
+            )
+
+        db.add(EventAttendee(event_id=event_id, user_id=current_user.id))
+        try:
+            db.commit()
+        except IntegrityError:
+            # El rollback también devuelve la plaza decrementada
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Already registered to event {event_id}",
+            )
+        # seats_available forma parte de las respuestas cacheadas y version
+        # es el SEQUENCE del VEVENT en el feed iCalendar
+        _invalidate_event(db, event_id, row.category_id)
+
+        return Registration(
+            event_id=event_id,
+            user_id=current_user.id,
+            seats_available=row.seats_available,
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        db.rollback()
+        logger.exception("Error registering to event")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to register to event",
+        )
+
+
+@router.delete("/{event_id}/register", summary="Cancel an event registration")
+def unregister_from_event(
+    event_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        deleted = db.execute(
+            delete(EventAttendee).where(
+                EventAttendee.event_id == event_id,
+                EventAttendee.user_id == current_user.id,
+            )
+        ).rowcount
+        if not deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Registration to event {event_id} not found",
+            )
+
+        # Sin límite de plazas seats_available sigue en NULL; version sube igual
+        table = EventModel.__table__
+        row = db.execute(
+            update(table)
+            .where(table.c.id == event_id)
+            .values(
+                seats_available=table.c.seats_available + 1,
+                version=table.c.version + 1,
+            )
+            .returning(table.c.category_id)
+        ).first()
+        db.commit()
+        _invalidate_event(db, event_id, row.category_id if row else None)
+        return {"message": "Registration cancelled successfully"}
+    except HTTPException:
+        raise
+    except Exception:
+        db.rollback()
+        logger.exception("Error cancelling registration")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to cancel registration",
+        )
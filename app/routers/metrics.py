@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Depends
+from app.core.metrics import metrics
+from app.dependencies.auth import get_current_user
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.get("/")
+def get_metrics(current_user: User = Depends(get_current_user)):
+    return metrics.snapshot()
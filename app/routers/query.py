@@ -0,0 +1,191 @@
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.category_cache import category_cache
+from app.core.config import settings
+from app.core.dataloader import DataLoader
+from app.core.profiling import ProfiledRoute
+from app.db.session import SessionLocal
+from app.models.events import Event as EventModel
+from app.models.user import User as UserModel
+from app.schemas.query import (
+    CategoriesQuery,
+    CategoryEventsSelection,
+    EventSelection,
+    EventsQuery,
+    QueryRequest,
+)
+
+router = APIRouter(route_class=ProfiledRoute)
+logger = logging.getLogger(__name__)
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _project(source, fields: Iterable[str]) -> dict:
+    return {field: getattr(source, field) for field in fields}
+
+
+class _Resolver:
+    """Resolves one query request.
+
+    Each selected relation costs one batched load per level, whatever the
+    number of rows: users come from a single ``IN`` query (per
+    ``query_in_chunk_size`` ids) and categories from ``category_cache``.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.categories = DataLoader(
+            category_cache.get_many,
+            chunk_size=settings.query_in_chunk_size,
+            name="categories",
+        )
+        self._user_loaders: Dict[Tuple[str, ...], DataLoader] = {}
+
+    def _users(self, fields: List[str]) -> DataLoader:
+        columns = tuple(sorted(set(fields) | {"id"}))
+        loader = self._user_loaders.get(columns)
+        if loader is None:
+
+            def batch(ids):
+                rows = self.db.execute(
+                    select(*[getattr(UserModel, c) for c in columns]).where(
+                        UserModel.id.in_(ids)
+                    )
+                ).all()
+                return {row.id: row for row in rows}
+
+            loader = self._user_loaders[columns] = DataLoader(
+                batch, chunk_size=settings.query_in_chunk_size, name="users"
+            )
+        return loader
+
+    @staticmethod
+    def _event_columns(selection: EventSelection) -> List:
+        columns = set(selection.fields) | {"id"}
+        if selection.category is not None:
+            columns.add("category_id")
+        if selection.user is not None:
+            columns.add("user_id")
+        return [getattr(EventModel, c) for c in sorted(columns)]
+
+    def _shape_events(self, rows, selection: EventSelection) -> List[dict]:
+        categories = {}
+        users = {}
+        if selection.category is not None:
+            categories = self.categories.load_many(row.category_id for row in rows)
+        if selection.user is not None:
+            users = self._users(selection.user.fields).load_many(
+                row.user_id for row in rows
+            )
+
+        result = []
+        for row in rows:
+            item = _project(row, selection.fields)
+            if selection.category is not None:
+                category = categories.get(row.category_id)
+                item["category"] = (
+                    _project(category, selection.category.fields) if category else None
+                )
+            if selection.user is not None:
+                user = users.get(row.user_id)
+                item["user"] = _project(user, selection.user.fields) if user else None
+            result.append(item)
+        return result
+
+    def events(self, query: EventsQuery) -> List[dict]:
+        stmt = select(*self._event_columns(query))
+        if query.filter.ids is not None:
+            stmt = stmt.where(EventModel.id.in_(query.filter.ids))
+        if query.filter.category_id is not None:
+            stmt = stmt.where(EventModel.category_id == query.filter.category_id)
+        if query.filter.start_from is not None:
+            stmt = stmt.where(EventModel.start_date >= query.filter.start_from)
+        if query.filter.start_to is not None:
+            stmt = stmt.where(EventModel.start_date < query.filter.start_to)
+        stmt = (
+            stmt.order_by(EventModel.start_date, EventModel.id)
+            .limit(query.limit)
+            .offset(query.offset)
+        )
+        return self._shape_events(self.db.execute(stmt).all(), query)
+
+    def _events_by_category(
+        self, category_ids: List[int], selection: CategoryEventsSelection
+    ) -> Dict[int, List[dict]]:
+        columns = self._event_columns(selection)
+        if EventModel.category_id not in columns:
+            columns.append(EventModel.category_id)
+        # Una sola consulta para todas las categorías, con límite por categoría
+        position = (
+            func.row_number()
+            .over(
+                partition_by=EventModel.category_id,
+                order_by=(EventModel.start_date, EventModel.id),
+            )
+            .label("position")
+        )
+        ranked = (
+            select(*columns, position)
+            .where(
+                EventModel.category_id.in_(category_ids),
+                EventModel.deleted_at.is_(None),
+            )
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(*[ranked.c[c.key] for c in columns])
+            .where(ranked.c.position <= selection.limit)
+            .order_by(ranked.c.category_id, ranked.c.position)
+        ).all()
+
+        shaped = self._shape_events(rows, selection)
+        by_category: Dict[int, List[dict]] = {i: [] for i in category_ids}
+        for row, item in zip(rows, shaped):
+            by_category[row.category_id].append(item)
+        return by_category
+
+    def categories_query(self, query: CategoriesQuery) -> List[dict]:
+        if query.ids is None:
+            categories = sorted(category_cache.all(), key=lambda c: c.id)
+        else:
+            found = self.categories.load_many(query.ids)
+            categories = [c for c in found.values() if c is not None]
+
+        result = [_project(category, query.fields) for category in categories]
+        if query.events is not None and categories:
+            events = self._events_by_category([c.id for c in categories], query.events)
+            for category, item in zip(categories, result):
+                item["events"] = events[category.id]
+        return result
+
+
+@router.post("/", summary="Field-selective query over events and categories")
+def run_query(request: QueryRequest, db: Session = Depends(get_db)):
+    try:
+        resolver = _Resolver(db)
+        response = {}
+        if request.events is not None:
+            response["events"] = resolver.events(request.events)
+        if request.categories is not None:
+            response["categories"] = resolver.categories_query(request.categories)
+        return response
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error running query")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to run query",
+        )
@@ -1,10 +1,28 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
 from app.dependencies.auth import get_current_user
+from app.models.user import User as DBUser
 from app.schemas.user import User
 
 router = APIRouter()
 
 
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 @router.get("/me", response_model=User)
-def read_users_me(current_user: User = Depends(get_current_user)):
-    return current_user
+def read_users_me(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+):
+    # El usuario de get_current_user viene de la caché sin la contraseña;
+    # la respuesta la incluye, así que se lee la fila completa
+    user = db.query(DBUser).filter(DBUser.id == current_user.id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="Usuario no encontrado")
+    return user
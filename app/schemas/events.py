@@ -1,10 +1,21 @@
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, List, Optional
 
 
-from app.schemas.user import User
+from app.schemas.user import UserSummary
 from app.schemas.category import Category
+from app.core.category_cache import category_cache
+from app.core.recurrence import parse_rule
+
+
+def _validate_recurrence_rule(value: str) -> str:
+    parse_rule(value)
+    return value
+
+
+RecurrenceRule = Annotated[str, AfterValidator(_validate_recurrence_rule)]
+
 
 class EventBase(BaseModel):
     name: str
@@ -16,6 +27,8 @@ class EventBase(BaseModel):
     user_id: int
     start_time: Optional[datetime] = None
     prize: Optional[str] = None
+    recurrence_rule: Optional[RecurrenceRule] = None
+    capacity: Optional[int] = Field(default=None, ge=1)
 
 
 class EventCreate(EventBase):
@@ -26,8 +39,41 @@ class EventUpdate(EventBase):
     pass
 
 
+_PATCH_REQUIRED_FIELDS = frozenset(
+    {"name", "description", "start_date", "end_date", "location", "category_id"}
+)
+
+
+class EventPatch(BaseModel):
+    # Solo se validan los campos enviados; el resto no se toca
+    name: Optional[str] = None
+    description: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    location: Optional[str] = None
+    category_id: Optional[int] = None
+    start_time: Optional[datetime] = None
+    prize: Optional[str] = None
+    recurrence_rule: Optional[RecurrenceRule] = None
+    capacity: Optional[int] = Field(default=None, ge=1)
+
+    @model_validator(mode="after")
+    def _reject_null_required_fields(self):
+        # Omitir un campo es válido; enviarlo a null no en columnas obligatorias
+        nulls = sorted(
+            field
+            for field in self.model_fields_set & _PATCH_REQUIRED_FIELDS
+            if getattr(self, field) is None
+        )
+        if nulls:
+            raise ValueError(f"Fields cannot be null: {', '.join(nulls)}")
+        return self
+
+
 class Event(EventBase):
     id: int
+    version: int
+    seats_available: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -42,8 +88,39 @@ class EventResponse(BaseModel):
     location: str
     start_time: Optional[datetime] = None
     prize: Optional[str] = None
+    recurrence_rule: Optional[str] = None
+    capacity: Optional[int] = None
+    seats_available: Optional[int] = None
+    version: int
+    updated_at: Optional[datetime] = None
     category: Category
-    user: User
+    user: UserSummary
 
     class Config:
         from_attributes = True
+
+
+def event_response(event) -> EventResponse:
+    """Build the response for an ``Event`` or ``EventArchive`` row.
+
+    The category comes from ``category_cache`` instead of a JOIN.
+    """
+    data = {c.key: getattr(event, c.key) for c in event.__table__.columns}
+    data["category"] = category_cache.get(event.category_id)
+    data["user"] = event.user
+    return EventResponse.model_validate(data)
+
+
+class Registration(BaseModel):
+    event_id: int
+    user_id: int
+    seats_available: Optional[int] = None
+
+
+class EventBatchRequest(BaseModel):
+    ids: List[int]
+
+
+class EventBatchResponse(BaseModel):
+    events: List[EventResponse]
+    missing: List[int]
@@ -0,0 +1,68 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from app.core.config import settings
+
+# Campos que se pueden seleccionar; la contraseña nunca se expone
+UserField = Literal["id", "first_name", "last_name", "username", "email", "is_active"]
+CategoryField = Literal["id", "name", "description"]
+EventField = Literal[
+    "id",
+    "name",
+    "description",
+    "start_date",
+    "end_date",
+    "start_time",
+    "prize",
+    "location",
+    "category_id",
+    "user_id",
+    "recurrence_rule",
+    "capacity",
+    "seats_available",
+    "version",
+]
+
+
+class UserSelection(BaseModel):
+    fields: List[UserField] = Field(min_length=1)
+
+
+class CategorySelection(BaseModel):
+    fields: List[CategoryField] = Field(min_length=1)
+
+
+class EventSelection(BaseModel):
+    fields: List[EventField] = Field(min_length=1)
+    category: Optional[CategorySelection] = None
+    user: Optional[UserSelection] = None
+
+
+class EventFilter(BaseModel):
+    # Cada id es un parámetro del IN: la lista se limita como el resto
+    ids: Optional[List[int]] = Field(default=None, max_length=settings.query_max_limit)
+    category_id: Optional[int] = None
+    start_from: Optional[datetime] = None
+    start_to: Optional[datetime] = None
+
+
+class EventsQuery(EventSelection):
+    filter: EventFilter = EventFilter()
+    limit: int = Field(default=100, ge=1, le=settings.query_max_limit)
+    offset: int = Field(default=0, ge=0)
+
+
+class CategoryEventsSelection(EventSelection):
+    # Límite de eventos por categoría
+    limit: int = Field(default=20, ge=1, le=settings.query_max_limit)
+
+
+class CategoriesQuery(CategorySelection):
+    ids: Optional[List[int]] = Field(default=None, max_length=settings.query_max_limit)
+    events: Optional[CategoryEventsSelection] = None
+
+
+class QueryRequest(BaseModel):
+    events: Optional[EventsQuery] = None
+    categories: Optional[CategoriesQuery] = None
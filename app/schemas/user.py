@@ -23,3 +23,17 @@ class User(UserBase):
 
     class Config:
         from_attributes = True
+
+
+class UserSummary(BaseModel):
+    """Owner embedded in event responses; never carries the password hash."""
+
+    id: int
+    first_name: str
+    last_name: str
+    username: str
+    email: str
+    is_active: bool
+
+    class Config:
+        from_attributes = True
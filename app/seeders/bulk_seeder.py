@@ -0,0 +1,239 @@
+import itertools
+import logging
+import math
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.security import hash_password
+from app.db.bulk import bulk_insert
+from app.db.session import engine as default_engine
+from app.models.category import Category
+from app.models.events import Event
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+DATE_DISTRIBUTIONS = ("uniform", "normal", "front-loaded")
+
+# Ajustes de SQLite solo durante la carga: se pierde durabilidad ante un
+# corte de luz, aceptable para bases de datos de prueba.
+_SQLITE_LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-262144",
+}
+
+_LOCATIONS = ["Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena", "Online"]
+_RECURRENCE_RULES = [
+    "FREQ=WEEKLY;COUNT=10",
+    "FREQ=MONTHLY;COUNT=6",
+    "FREQ=DAILY;COUNT=5",
+]
+
+
+class BulkSeeder:
+    """Generates users and events at volume for capacity testing.
+
+    Rows are built lazily and written in chunks of ``chunk_size`` (COPY on
+    PostgreSQL, Core ``INSERT`` executemany elsewhere), one transaction per
+    chunk, on a single connection. Pass ``seed`` to get the same data on every run.
+    """
+
+    def __init__(
+        self,
+        engine: Engine = default_engine,
+        chunk_size: int = 10000,
+        seed: Optional[int] = None,
+    ):
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+
+    @contextmanager
+    def _load_connection(self) -> Iterator[Connection]:
+        with self.engine.connect() as conn:
+            if conn.dialect.name == "postgresql":
+                # Equivalente a synchronous=OFF, limitado a esta sesión
+                conn.exec_driver_sql("SET synchronous_commit TO off")
+                conn.commit()
+                try:
+                    yield conn
+                finally:
+                    conn.rollback()
+                    conn.exec_driver_sql("RESET synchronous_commit")
+                    conn.commit()
+                return
+            if conn.dialect.name != "sqlite":
+                yield conn
+                return
+
+            previous = {
+                name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+                for name in _SQLITE_LOAD_PRAGMAS
+            }
+            for name, value in _SQLITE_LOAD_PRAGMAS.items():
+                conn.exec_driver_sql(f"PRAGMA {name} = {value}")
+            conn.commit()
+            try:
+                yield conn
+            finally:
+                conn.rollback()
+                for name, value in previous.items():
+                    conn.exec_driver_sql(f"PRAGMA {name} = {value}")
+                conn.commit()
+
+    def _insert_chunks(self, conn: Connection, table, rows: Iterator[dict]) -> int:
+        total = 0
+        chunk: List[dict] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                total += self._flush(conn, table, chunk)
+                chunk = []
+        if chunk:
+            total += self._flush(conn, table, chunk)
+        return total
+
+    def _flush(self, conn: Connection, table, chunk: List[dict]) -> int:
+        bulk_insert(conn, table, chunk)
+        conn.commit()
+        return len(chunk)
+
+    def _report(self, label: str, rows: int, started: float) -> float:
+        elapsed = time.perf_counter() - started
+        rate = rows / elapsed if elapsed > 0 else float(rows)
+        logger.info(f"✓ Inserted {rows} {label} in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+        return rate
+
+    def seed_users(self, count: int, password: str = "password") -> float:
+        """Insert ``count`` users sharing one password; returns rows/second."""
+        # bcrypt es lento a propósito: se calcula un único hash para todos
+        hashed = hash_password(password)
+        table = User.__table__
+        started = time.perf_counter()
+
+        with self._load_connection() as conn:
+            offset = conn.execute(
+                select(func.coalesce(func.max(table.c.id), 0))
+            ).scalar()
+
+            def rows():
+                for n in range(offset + 1, offset + count + 1):
+                    yield {
+                        "first_name": f"User{n}",
+                        "last_name": "Seed",
+                        "username": f"seed_user_{n}",
+                        "email": f"seed_user_{n}@example.com",
+                        "password": hashed,
+                        "is_active": True,
+                    }
+
+            inserted = self._insert_chunks(conn, table, rows())
+        return self._report("users", inserted, started)
+
+    def _start_offset(self, days: int, distribution: str) -> float:
+        if distribution == "normal":
+            value = self.random.gauss(days / 2, days / 6)
+        elif distribution == "front-loaded":
+            # La mayoría de eventos en los primeros días de la ventana
+            value = self.random.expovariate(4 / days)
+        else:
+            value = self.random.uniform(0, days)
+        return min(max(value, 0.0), float(days))
+
+    def seed_events(
+        self,
+        count: int,
+        start: datetime,
+        days: int = 365,
+        distribution: str = "uniform",
+        category_weights: Optional[Dict[int, float]] = None,
+        capacity_ratio: float = 0.3,
+        recurring_ratio: float = 0.05,
+    ) -> float:
+        """Insert ``count`` events; returns rows/second.
+
+        Start dates follow ``distribution`` over ``[start, start + days]``
+        and categories are picked with ``category_weights`` (uniform when
+        omitted). Owners are drawn from the existing users.
+        """
+        if distribution not in DATE_DISTRIBUTIONS:
+            raise ValueError(f"Unknown date distribution: {distribution}")
+        table = Event.__table__
+        started = time.perf_counter()
+
+        with self._load_connection() as conn:
+            category_ids = list(conn.execute(select(Category.__table__.c.id)).scalars())
+            user_ids = list(conn.execute(select(User.__table__.c.id)).scalars())
+            if not category_ids or not user_ids:
+                raise ValueError("Seed categories and users before events")
+
+            weights_by_id = category_weights or {}
+            unknown = set(weights_by_id) - set(category_ids)
+            if unknown:
+                raise ValueError(f"Unknown category ids: {sorted(unknown)}")
+            weights = [
+                weights_by_id.get(i, 0 if weights_by_id else 1) for i in category_ids
+            ]
+            if not math.fsum(weights) > 0:
+                raise ValueError("Category weights must not all be zero")
+
+            cum_weights = list(itertools.accumulate(weights))
+            rand = self.random
+            # COPY no aplica los defaults de Python: updated_at va explícito
+            seeded_at = datetime.now()
+
+            def rows():
+                for n in range(count):
+                    offset_days = self._start_offset(days, distribution)
+                    start_date = (start + timedelta(days=offset_days)).replace(
+                        second=0, microsecond=0
+                    )
+                    capacity = (
+                        rand.choice((20, 50, 100, 500))
+                        if rand.random() < capacity_ratio
+                        else None
+                    )
+                    yield {
+                        "name": f"Evento {n + 1}",
+                        "description": "Evento generado para pruebas de carga",
+                        "start_date": start_date,
+                        "end_date": start_date + timedelta(hours=rand.randint(1, 8)),
+                        "start_time": start_date,
+                        "prize": None,
+                        "location": rand.choice(_LOCATIONS),
+                        "category_id": rand.choices(
+                            category_ids, cum_weights=cum_weights
+                        )[0],
+                        "user_id": rand.choice(user_ids),
+                        "recurrence_rule": (
+                            rand.choice(_RECURRENCE_RULES)
+                            if rand.random() < recurring_ratio
+                            else None
+                        ),
+                        "capacity": capacity,
+                        "seats_available": capacity,
+                        "deleted_at": None,
+                        "updated_at": seeded_at,
+                        "version": 1,
+                    }
+
+            inserted = self._insert_chunks(conn, table, rows())
+        return self._report("events", inserted, started)
+
+
+def parse_category_weights(value: str) -> Dict[int, float]:
+    """Parse ``"1=5,2=3,3=1"`` into ``{1: 5.0, 2: 3.0, 3: 1.0}``."""
+    weights = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        category_id, _, weight = part.partition("=")
+        weights[int(category_id)] = float(weight)
+    return weights
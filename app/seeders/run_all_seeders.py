@@ -1,5 +1,12 @@
+import argparse
 import logging
+from datetime import datetime
 from app.db.session import SessionLocal
+from app.seeders.bulk_seeder import (
+    DATE_DISTRIBUTIONS,
+    BulkSeeder,
+    parse_category_weights,
+)
 from app.seeders.category_seeder import CategorySeeder
 
 logging.basicConfig(
@@ -8,7 +15,39 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_all_seeders():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Seed the database. Without --users/--events only the "
+        "predefined categories are created."
+    )
+    parser.add_argument("--users", type=int, default=0,
+                        help="Number of users to generate")
+    parser.add_argument("--events", type=int, default=0,
+                        help="Number of events to generate")
+    parser.add_argument("--chunk-size", type=int, default=10000,
+                        help="Rows per INSERT batch")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed for reproducible data")
+    parser.add_argument("--start-date", type=datetime.fromisoformat,
+                        default=None,
+                        help="First event date (ISO format, default: now)")
+    parser.add_argument("--days", type=int, default=365,
+                        help="Days covered by the event dates")
+    parser.add_argument("--date-distribution", choices=DATE_DISTRIBUTIONS,
+                        default="uniform")
+    parser.add_argument("--category-weights", type=parse_category_weights,
+                        default=None,
+                        help='Relative weight per category id, e.g. "1=5,2=3,3=1"')
+    parser.add_argument("--capacity-ratio", type=float, default=0.3,
+                        help="Fraction of events with limited capacity")
+    parser.add_argument("--recurring-ratio", type=float, default=0.05,
+                        help="Fraction of recurring events")
+    return parser.parse_args(argv)
+
+
+def run_all_seeders(args=None):
+    if args is None:
+        args = parse_args([])
     logger.info("Starting database seeding process...")
     db = SessionLocal()
 
@@ -19,6 +58,23 @@ def run_all_seeders():
         for category in categories:
             logger.info(f"  - {category.name}")
 
+        if args.users or args.events:
+            bulk_seeder = BulkSeeder(chunk_size=args.chunk_size, seed=args.seed)
+            if args.users:
+                logger.info(f"Generating {args.users} users...")
+                bulk_seeder.seed_users(args.users)
+            if args.events:
+                logger.info(f"Generating {args.events} events...")
+                bulk_seeder.seed_events(
+                    args.events,
+                    start=args.start_date or datetime.now(),
+                    days=args.days,
+                    distribution=args.date_distribution,
+                    category_weights=args.category_weights,
+                    capacity_ratio=args.capacity_ratio,
+                    recurring_ratio=args.recurring_ratio,
+                )
+
         logger.info("✓ All database seeders completed successfully!")
 
     except Exception as e:
@@ -30,4 +86,4 @@ def run_all_seeders():
 
 
 if __name__ == "__main__":
-    run_all_seeders()
+    run_all_seeders(parse_args())
@@ -0,0 +1,3 @@
+"""
+Background tasks that run inside the API process.
+"""
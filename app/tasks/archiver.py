@@ -0,0 +1,134 @@
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, literal, select
+
+from app.core.cache import event_cache
+from app.core.config import settings
+from app.core.ical import calendar_feed_cache
+from app.core.metrics import metrics
+from app.db.session import SessionLocal
+from app.models.attendee import EventAttendee
+from app.models.event_archive import EventArchive, EventAttendeeArchive
+from app.models.events import Event
+from app.tasks.periodic import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+
+class EventArchiver(PeriodicTask):
+    """Moves finished events into ``events_archive`` in bounded batches.
+
+    Only non-recurring events whose ``end_date`` is older than the retention
+    window are moved, together with their attendees. Soft-deleted events are
+    left to the purger.
+    """
+
+    metrics_prefix = "events.archive"
+    description = "archiving events"
+
+    def __init__(
+        self,
+        batch_size: int,
+        retention_days: int,
+        interval_seconds: int,
+        max_inflight_requests: int,
+    ):
+        super().__init__(interval_seconds, max_inflight_requests)
+        self.batch_size = batch_size
+        self.retention_days = retention_days
+
+    def archive_batch(self) -> int:
+        now = datetime.now()
+        cutoff = now - timedelta(days=self.retention_days)
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(Event.id, Event.category_id)
+                .where(
+                    Event.end_date < cutoff,
+                    Event.recurrence_rule.is_(None),
+                    Event.deleted_at.is_(None),
+                )
+                .order_by(Event.end_date)
+                .limit(self.batch_size)
+            ).all()
+            if not rows:
+                return 0
+            ids = [row.id for row in rows]
+
+            archive_columns = [
+                column.key
+                for column in EventArchive.__table__.columns
+                if column.key != "archived_at"
+            ]
+            attendee_columns = [c.key for c in EventAttendeeArchive.__table__.columns]
+
+            start = time.perf_counter()
+            db.execute(
+                insert(EventArchive).from_select(
+                    archive_columns + ["archived_at"],
+                    select(
+                        *[Event.__table__.c[key] for key in archive_columns],
+                        literal(now),
+                    ).where(Event.id.in_(ids)),
+                )
+            )
+            db.execute(
+                insert(EventAttendeeArchive).from_select(
+                    attendee_columns,
+                    select(
+                        *[EventAttendee.__table__.c[key] for key in attendee_columns]
+                    ).where(EventAttendee.event_id.in_(ids)),
+                )
+            )
+            db.execute(
+                delete(EventAttendee)
+                .where(EventAttendee.event_id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(
+                delete(Event)
+                .where(Event.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            metrics.observe("events.archive.lock_seconds", time.perf_counter() - start)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for row in rows:
+            event_cache.delete(str(row.id))
+            calendar_feed_cache.invalidate_event(row.id, row.category_id)
+        return len(ids)
+
+    def archive(self) -> int:
+        total = 0
+        start = time.perf_counter()
+        while not self.is_busy():
+            archived = self.archive_batch()
+            total += archived
+            if archived < self.batch_size:
+                break
+
+        elapsed = time.perf_counter() - start
+        if total:
+            metrics.incr("events.archive.rows", total)
+            metrics.gauge("events.archive.rows_per_second", total / elapsed)
+            logger.info(f"Archived {total} finished events in {elapsed:.3f}s")
+        return total
+
+    def run_once(self) -> int:
+        return self.archive()
+
+
+event_archiver = EventArchiver(
+    batch_size=settings.archive_batch_size,
+    retention_days=settings.archive_retention_days,
+    interval_seconds=settings.archive_interval_seconds,
+    max_inflight_requests=settings.archive_max_inflight_requests,
+)
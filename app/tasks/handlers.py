@@ -0,0 +1,25 @@
+import logging
+
+from app.tasks.queue import job_queue
+
+logger = logging.getLogger(__name__)
+
+
+@job_queue.handler("event.created")
+def on_event_created(payload: dict) -> None:
+    logger.debug(f"Event created: {payload}")
+
+
+@job_queue.handler("event.updated")
+def on_event_updated(payload: dict) -> None:
+    logger.debug(f"Event updated: {payload}")
+
+
+@job_queue.handler("event.deleted")
+def on_event_deleted(payload: dict) -> None:
+    logger.debug(f"Event deleted: {payload}")
+
+
+@job_queue.handler("user.registered")
+def on_user_registered(payload: dict) -> None:
+    logger.debug(f"User registered: {payload}")
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask(ABC):
+    """Runs ``run_once`` in a worker thread every ``interval_seconds``.
+
+    A run is skipped while more than ``max_inflight_requests`` requests are
+    in flight; subclasses also check ``is_busy`` between batches. Skips and
+    errors are counted under ``metrics_prefix``.
+    """
+
+    metrics_prefix: str
+    description: str
+
+    def __init__(self, interval_seconds: int, max_inflight_requests: int):
+        self.interval_seconds = interval_seconds
+        self.max_inflight_requests = max_inflight_requests
+        self._task: Optional[asyncio.Task] = None
+
+    def is_busy(self) -> bool:
+        return metrics.get_gauge("http.inflight") > self.max_inflight_requests
+
+    @abstractmethod
+    def run_once(self) -> int:
+        """Do one pass of work; returns the number of rows processed."""
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            if self.is_busy():
+                metrics.incr(f"{self.metrics_prefix}.skipped_busy")
+                continue
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                metrics.incr(f"{self.metrics_prefix}.errors")
+                logger.error(f"Error {self.description}: {str(e)}")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
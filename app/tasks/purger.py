@@ -0,0 +1,132 @@
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import SessionLocal
+from app.models.attendee import EventAttendee
+from app.models.event_tombstone import EventTombstone
+from app.models.events import Event
+from app.tasks.periodic import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+
+class EventPurger(PeriodicTask):
+    """Hard-deletes soft-deleted events in bounded batches while load is low.
+
+    Each purged id leaves a tombstone so delta syncs can still report it as
+    removed; tombstones older than ``tombstone_retention_days`` are dropped.
+    """
+
+    metrics_prefix = "events.purge"
+    description = "purging events"
+
+    def __init__(
+        self,
+        batch_size: int,
+        retention_seconds: int,
+        tombstone_retention_days: int,
+        interval_seconds: int,
+        max_inflight_requests: int,
+    ):
+        super().__init__(interval_seconds, max_inflight_requests)
+        self.batch_size = batch_size
+        self.retention_seconds = retention_seconds
+        self.tombstone_retention_days = tombstone_retention_days
+
+    def purge_batch(self) -> int:
+        cutoff = datetime.now() - timedelta(seconds=self.retention_seconds)
+        db = SessionLocal()
+        try:
+            ids = (
+                db.execute(
+                    select(Event.id)
+                    .where(Event.deleted_at.is_not(None), Event.deleted_at < cutoff)
+                    .order_by(Event.deleted_at)
+                    .limit(self.batch_size)
+                    .execution_options(include_deleted=True)
+                )
+                .scalars()
+                .all()
+            )
+            if not ids:
+                return 0
+
+            # El lock de escritura se mantiene desde el DELETE hasta el commit
+            start = time.perf_counter()
+            db.execute(
+                insert(EventTombstone).from_select(
+                    ["id", "deleted_at"],
+                    select(Event.id, Event.deleted_at)
+                    .where(Event.id.in_(ids))
+                    .execution_options(include_deleted=True),
+                )
+            )
+            db.execute(
+                delete(EventAttendee)
+                .where(EventAttendee.event_id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(
+                delete(Event)
+                .where(Event.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            metrics.observe("events.purge.lock_seconds", time.perf_counter() - start)
+            return len(ids)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def expire_tombstones(self) -> int:
+        cutoff = datetime.now() - timedelta(days=self.tombstone_retention_days)
+        db = SessionLocal()
+        try:
+            result = db.execute(
+                delete(EventTombstone).where(EventTombstone.deleted_at < cutoff)
+            )
+            db.commit()
+            return result.rowcount
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def purge(self) -> int:
+        total = 0
+        start = time.perf_counter()
+        while not self.is_busy():
+            purged = self.purge_batch()
+            total += purged
+            if purged < self.batch_size:
+                break
+        expired = self.expire_tombstones()
+
+        elapsed = time.perf_counter() - start
+        if total:
+            metrics.incr("events.purge.rows", total)
+            metrics.gauge("events.purge.rows_per_second", total / elapsed)
+            logger.info(f"Purged {total} soft-deleted events in {elapsed:.3f}s")
+        if expired:
+            metrics.incr("events.purge.tombstones_expired", expired)
+        return total
+
+    def run_once(self) -> int:
+        return self.purge()
+
+
+event_purger = EventPurger(
+    batch_size=settings.purge_batch_size,
+    retention_seconds=settings.purge_retention_seconds,
+    tombstone_retention_days=settings.purge_tombstone_retention_days,
+    interval_seconds=settings.purge_interval_seconds,
+    max_inflight_requests=settings.purge_max_inflight_requests,
+)
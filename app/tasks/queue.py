@@ -0,0 +1,223 @@
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.local_store import open_local_db
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+QUEUED = "queued"
+DEAD = "dead"
+
+_STOP = object()
+
+
+class JobQueue:
+    """In-process job queue with a worker pool and a persistent SQLite outbox.
+
+    Every job is written to the outbox before it is handed to the in-memory
+    queue, so jobs that were pending or running survive a restart. Failed jobs
+    are retried with exponential backoff and marked dead after
+    ``max_attempts``.
+    """
+
+    def __init__(
+        self,
+        outbox_path: str,
+        workers: int,
+        capacity: int,
+        max_attempts: int,
+        backoff_seconds: float,
+        poll_interval_seconds: float,
+    ):
+        self.outbox_path = outbox_path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self._queue = queue.Queue(maxsize=capacity)
+        self._handlers: Dict[str, Callable[[dict], None]] = {}
+        self._threads = []
+        self._stop = threading.Event()
+        self._db_lock = threading.Lock()
+        self._conn = None
+
+    def handler(self, name: str):
+        def decorator(func: Callable[[dict], None]):
+            self._handlers[name] = func
+            return func
+
+        return decorator
+
+    def _db(self):
+        if self._conn is None:
+            self._conn = open_local_db(self.outbox_path)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    run_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_error TEXT
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_jobs_status_run_at "
+                "ON jobs (status, run_at)"
+            )
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()):
+        with self._db_lock:
+            return self._db().execute(sql, params)
+
+    def enqueue(self, name: str, payload: dict) -> Optional[int]:
+        if not self._threads:
+            # Sin workers (JOBS_ENABLED=false) nadie vaciaría el outbox
+            metrics.incr("jobs.skipped")
+            return None
+
+        now = time.time()
+        try:
+            with self._db_lock:
+                cursor = self._db().execute(
+                    "INSERT INTO jobs (name, payload, status, run_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name, json.dumps(payload), PENDING, now, now),
+                )
+                job_id = cursor.lastrowid
+        except Exception as e:
+            metrics.incr("jobs.enqueue_errors")
+            logger.error(f"Error enqueuing job {name}: {str(e)}")
+            return None
+
+        metrics.incr("jobs.enqueued")
+        self._offer((job_id, name, payload, 0, now))
+        return job_id
+
+    def _offer(self, job: tuple) -> bool:
+        # Se marca antes del put: un worker rápido puede volver a dejarlo
+        # PENDING con backoff y esa escritura no debe quedar pisada
+        self._execute("UPDATE jobs SET status = ? WHERE id = ?", (QUEUED, job[0]))
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            # El job sigue pendiente en el outbox; el poller lo reintentará
+            self._execute(
+                "UPDATE jobs SET status = ? WHERE id = ? AND status = ?",
+                (PENDING, job[0], QUEUED),
+            )
+            metrics.incr("jobs.deferred")
+            return False
+        metrics.gauge("jobs.queue_depth", self._queue.qsize())
+        return True
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.poll_interval_seconds):
+            try:
+                rows = self._execute(
+                    "SELECT id, name, payload, attempts, created_at FROM jobs "
+                    "WHERE status = ? AND run_at <= ? ORDER BY run_at LIMIT ?",
+                    (PENDING, time.time(), self._queue.maxsize),
+                ).fetchall()
+                for job_id, name, payload, attempts, created_at in rows:
+                    job = (job_id, name, json.loads(payload), attempts, created_at)
+                    if not self._offer(job):
+                        break
+                backlog = self._execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = ?", (PENDING,)
+                ).fetchone()[0]
+                metrics.gauge("jobs.outbox_pending", backlog)
+            except Exception as e:
+                logger.error(f"Error polling job outbox: {str(e)}")
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            metrics.gauge("jobs.queue_depth", self._queue.qsize())
+            self._run(*job)
+
+    def _run(self, job_id, name, payload, attempts, created_at) -> None:
+        func = self._handlers.get(name)
+        if func is None:
+            logger.error(f"No handler registered for job {name}")
+            self._execute(
+                "UPDATE jobs SET status = ?, last_error = ? WHERE id = ?",
+                (DEAD, "no handler", job_id),
+            )
+            metrics.incr("jobs.dead")
+            return
+
+        start = time.perf_counter()
+        try:
+            func(payload)
+        except Exception as e:
+            attempts += 1
+            if attempts >= self.max_attempts:
+                status, run_at = DEAD, time.time()
+                metrics.incr("jobs.dead")
+                logger.error(f"Job {name} ({job_id}) failed permanently: {str(e)}")
+            else:
+                status = PENDING
+                run_at = time.time() + self.backoff_seconds * 2 ** (attempts - 1)
+                metrics.incr("jobs.retried")
+            self._execute(
+                "UPDATE jobs SET status = ?, attempts = ?, run_at = ?, last_error = ? "
+                "WHERE id = ?",
+                (status, attempts, run_at, str(e), job_id),
+            )
+            return
+
+        self._execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        metrics.incr("jobs.succeeded")
+        metrics.observe("jobs.run_seconds", time.perf_counter() - start)
+        metrics.observe("jobs.latency_seconds", time.time() - created_at)
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        # Los jobs que estaban en memoria al apagarse vuelven a quedar pendientes
+        self._execute("UPDATE jobs SET status = ? WHERE status = ?", (PENDING, QUEUED))
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        poller = threading.Thread(target=self._poll, name="job-poller", daemon=True)
+        poller.start()
+        self._threads.append(poller)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if not self._threads:
+            return
+        self._stop.set()
+        for _ in range(self.workers):
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+job_queue = JobQueue(
+    outbox_path=settings.jobs_outbox_path,
+    workers=settings.jobs_workers,
+    capacity=settings.jobs_queue_capacity,
+    max_attempts=settings.jobs_max_attempts,
+    backoff_seconds=settings.jobs_retry_backoff_seconds,
+    poll_interval_seconds=settings.jobs_poll_interval_seconds,
+)
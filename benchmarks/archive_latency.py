@@ -0,0 +1,125 @@
+"""Hot-set latency of GET /events/ before and after archiving old events.
+
+Builds a scratch database with ``--history`` events spread over the past
+``--years`` plus ``--recent`` events around today, measures the median and
+p95 latency of ``GET /events/?time_filter=week`` in-process, runs the
+archiver until the hot table only holds events inside the retention window
+and measures again.
+
+    python -m benchmarks.archive_latency --history 300000 --recent 3000
+
+``--database-url`` defaults to a throwaway SQLite file; any URL given must
+point to an empty database, whose schema is created from the models.
+"""
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _measure(client, requests: int) -> Dict[str, float]:
+    # La primera petición carga cachés y compila sentencias; no se cuenta
+    client.get("/events/", params={"time_filter": "week"}).raise_for_status()
+    latencies: List[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.get("/events/", params={"time_filter": "week"}).raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def run_benchmark(history: int, recent: int, years: int, requests: int) -> None:
+    # Los módulos de la app leen DATABASE_URL al importarse
+    from fastapi.testclient import TestClient
+    from sqlalchemy import func, select
+
+    from app.db.base import Base
+    from app.db.session import SessionLocal, engine
+    from app.models.event_archive import EventArchive
+    from app.models.events import Event
+    from app.seeders.bulk_seeder import BulkSeeder
+    from app.seeders.category_seeder import CategorySeeder
+    from app.tasks.archiver import event_archiver
+    from main import app, log_listener
+
+    Base.metadata.create_all(engine)
+    CategorySeeder.seed()
+    seeder = BulkSeeder(seed=42)
+    seeder.seed_users(100)
+    now = datetime.now()
+    seeder.seed_events(history, start=now - timedelta(days=365 * years),
+                       days=365 * years, recurring_ratio=0)
+    seeder.seed_events(recent, start=now - timedelta(days=7), days=14,
+                       recurring_ratio=0)
+
+    # Sin el context manager no arrancan las tareas en segundo plano
+    client = TestClient(app)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    before = _measure(client, requests)
+
+    start = time.perf_counter()
+    archived = 0
+    while True:
+        moved = event_archiver.archive()
+        archived += moved
+        if not moved:
+            break
+    elapsed = time.perf_counter() - start
+
+    after = _measure(client, requests)
+
+    db = SessionLocal()
+    try:
+        hot = db.execute(select(func.count()).select_from(Event)).scalar()
+        cold = db.execute(select(func.count()).select_from(EventArchive)).scalar()
+    finally:
+        db.close()
+
+    logger.info(f"Archived {archived} events in {elapsed:.1f}s "
+                f"(hot: {hot}, archive: {cold})")
+    logger.info(f"GET /events/?time_filter=week before: "
+                f"p50={before['p50_ms']:.1f}ms p95={before['p95_ms']:.1f}ms")
+    logger.info(f"GET /events/?time_filter=week after:  "
+                f"p50={after['p50_ms']:.1f}ms p95={after['p95_ms']:.1f}ms")
+    # El listener escribe en otro hilo: se vacía antes de salir
+    log_listener.stop()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url",
+                        help="Empty database to use (default: temporary SQLite file)")
+    parser.add_argument("--history", type=int, default=300000,
+                        help="Events spread over the past --years")
+    parser.add_argument("--recent", type=int, default=3000,
+                        help="Events within a week of today")
+    parser.add_argument("--years", type=int, default=5,
+                        help="Span of the historical events")
+    parser.add_argument("--requests", type=int, default=50,
+                        help="Timed requests per measurement")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    database_url = args.database_url or (
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'archive_bench.db')}"
+    )
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    # Sin workers de la cola los jobs de escritura no se acumulan
+    os.environ.setdefault("JOBS_ENABLED", "false")
+    run_benchmark(args.history, args.recent, args.years, args.requests)
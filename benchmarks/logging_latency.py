@@ -0,0 +1,139 @@
+"""Request latency under heavy error logging: queue logging vs a plain handler.
+
+Mounts a route that logs ``--errors-per-request`` errors with tracebacks,
+fires ``--requests`` requests at it from ``--concurrency`` threads through
+the app's middleware stack and reports p50/p95 latency twice: with the
+app's queue-backed logging (``setup_logging``) and with a plain
+``StreamHandler`` writing from the request thread. Both write the same JSON
+lines to the same sink; ``--write-delay-ms`` simulates a slow consumer such
+as a blocked stdout pipe.
+
+    python -m benchmarks.logging_latency --requests 2000 --write-delay-ms 1
+"""
+import argparse
+import contextlib
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class _SlowStream:
+    """File wrapper whose writes take at least ``delay`` seconds."""
+
+    def __init__(self, stream: TextIO, delay: float):
+        self._stream = stream
+        self._delay = delay
+
+    def write(self, data: str) -> int:
+        if self._delay:
+            time.sleep(self._delay)
+        return self._stream.write(data)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+def _measure(client, requests: int, concurrency: int) -> Dict[str, float]:
+    def timed(_):
+        start = time.perf_counter()
+        client.get("/_benchmark/log-errors").raise_for_status()
+        return time.perf_counter() - start
+
+    # La primera petición compila rutas y calienta el middleware; no se cuenta
+    timed(None)
+    with ThreadPoolExecutor(concurrency) as pool:
+        latencies: List[float] = sorted(pool.map(timed, range(requests)))
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def run_benchmark(requests: int, concurrency: int, errors_per_request: int,
+                  write_delay_ms: float, log_file: str) -> None:
+    # Los módulos de la app leen DATABASE_URL al importarse
+    from fastapi.testclient import TestClient
+
+    from app.core.config import settings
+    from app.core.logging_config import JsonFormatter, RequestIdFilter, setup_logging
+    from main import app, log_listener
+
+    bench_logger = logging.getLogger("benchmarks.logging_latency.route")
+
+    def log_errors():
+        for n in range(errors_per_request):
+            try:
+                raise ValueError(f"benchmark error {n}")
+            except ValueError:
+                bench_logger.exception("Error handling benchmark request")
+        return {"logged": errors_per_request}
+
+    app.add_api_route("/_benchmark/log-errors", log_errors, methods=["GET"])
+    # Sin el context manager no arrancan las tareas en segundo plano
+    client = TestClient(app)
+    log_listener.stop()
+
+    results = {}
+    with open(log_file, "a", encoding="utf-8") as sink:
+        stream = _SlowStream(sink, write_delay_ms / 1000)
+
+        # setup_logging escribe en sys.stdout: se redirige al sumidero
+        with contextlib.redirect_stdout(stream):
+            listener = setup_logging(settings.log_level, 1.0)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        results["queue"] = _measure(client, requests, concurrency)
+        # Vaciar la cola no forma parte de la latencia de las peticiones
+        listener.stop()
+
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(JsonFormatter())
+        handler.addFilter(RequestIdFilter())
+        logging.getLogger().handlers = [handler]
+        results["stream"] = _measure(client, requests, concurrency)
+
+    # Los resultados van a la consola, no al sumidero del benchmark
+    console = logging.StreamHandler(sys.stderr)
+    console.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.getLogger().handlers = [console]
+    logger.info(f"{requests} requests, {concurrency} threads, "
+                f"{errors_per_request} errors/request, "
+                f"{write_delay_ms}ms per write -> {log_file}")
+    for mode, label in (("queue", "QueueHandler"), ("stream", "StreamHandler")):
+        logger.info(f"{label:<13} p50={results[mode]['p50_ms']:.2f}ms "
+                    f"p95={results[mode]['p95_ms']:.2f}ms")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000,
+                        help="Timed requests per logging setup")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Parallel client threads")
+    parser.add_argument("--errors-per-request", type=int, default=5,
+                        help="Errors with traceback logged by each request")
+    parser.add_argument("--write-delay-ms", type=float, default=0.0,
+                        help="Simulated latency of each log write")
+    parser.add_argument("--log-file",
+                        help="Where log lines go (default: temporary file)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    log_file = args.log_file or os.path.join(tempfile.mkdtemp(), "logging_bench.log")
+    os.environ.setdefault(
+        "DATABASE_URL",
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'logging_bench.db')}",
+    )
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("JOBS_ENABLED", "false")
+    run_benchmark(args.requests, args.concurrency, args.errors_per_request,
+                  args.write_delay_ms, log_file)
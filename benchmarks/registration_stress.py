@@ -0,0 +1,149 @@
+"""Concurrency stress test for event registration against a running server.
+
+Registers ``--users`` accounts, creates one event with ``--capacity`` seats
+and fires every registration at once from ``--concurrency`` threads. Checks
+that exactly ``min(capacity, users)`` registrations succeed, the rest get
+409, and ``seats_available`` never goes negative; reports throughput and
+latency percentiles. Exits with status 1 if seats were oversold.
+
+    uvicorn main:app --workers 4 &
+    python -m benchmarks.registration_stress --base-url http://localhost:8000
+"""
+import argparse
+import logging
+import sys
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import httpx
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+# Una línea por petición taparía el resumen
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def _create_user(client: httpx.Client, prefix: str, index: int) -> str:
+    username = f"{prefix}-{index}"
+    client.post(
+        "/auth/register",
+        json={
+            "first_name": "Stress",
+            "last_name": str(index),
+            "username": username,
+            "email": f"{username}@stress.local",
+            "password": "stress-password",
+            "is_active": True,
+        },
+    ).raise_for_status()
+    response = client.post(
+        "/auth/login", data={"username": username, "password": "stress-password"}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def _register(client: httpx.Client, event_id: int, token: str) -> Tuple[int, float]:
+    start = time.perf_counter()
+    response = client.post(
+        f"/events/{event_id}/register",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return response.status_code, time.perf_counter() - start
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_stress(base_url: str, users: int, capacity: int, concurrency: int,
+               category_id: int, setup_concurrency: int) -> bool:
+    prefix = f"stress-{uuid.uuid4().hex[:8]}"
+    limits = httpx.Limits(max_connections=concurrency)
+    with httpx.Client(base_url=base_url, limits=limits, timeout=60) as client, \
+            ThreadPoolExecutor(concurrency) as pool:
+        logger.info(f"Creating {users} users...")
+        # El alta está limitada por bcrypt; más hilos solo alargan cada petición
+        with ThreadPoolExecutor(setup_concurrency) as setup_pool:
+            tokens = list(
+                setup_pool.map(lambda i: _create_user(client, prefix, i), range(users))
+            )
+
+        response = client.post(
+            "/events/",
+            headers={"Authorization": f"Bearer {tokens[0]}"},
+            json={
+                "name": f"{prefix} event",
+                "description": "Registration stress test",
+                "start_date": "2030-01-01T10:00:00",
+                "end_date": "2030-01-01T12:00:00",
+                "location": "Stress",
+                "category_id": category_id,
+                "user_id": 0,
+                "capacity": capacity,
+            },
+        )
+        response.raise_for_status()
+        event_id = response.json()["id"]
+
+        logger.info(f"Registering {users} users to event {event_id} "
+                    f"({capacity} seats, {concurrency} threads)...")
+        start = time.perf_counter()
+        results = list(pool.map(lambda token: _register(client, event_id, token), tokens))
+        elapsed = time.perf_counter() - start
+
+        seats_available = client.get(f"/events/{event_id}").json()["seats_available"]
+
+    statuses = Counter(code for code, _ in results)
+    latencies = [latency for _, latency in results]
+    accepted = statuses.get(201, 0)
+    expected = min(capacity, users)
+
+    logger.info(f"Status codes: {dict(statuses)}")
+    logger.info(f"Throughput: {len(results) / elapsed:,.0f} requests/s "
+                f"({len(results)} requests in {elapsed:.2f}s)")
+    logger.info(f"Latency p50={_percentile(latencies, 0.5) * 1000:.1f}ms "
+                f"p99={_percentile(latencies, 0.99) * 1000:.1f}ms")
+    logger.info(f"Accepted {accepted}/{expected}, seats_available={seats_available}")
+
+    ok = (
+        accepted == expected
+        and statuses.get(409, 0) == users - expected
+        and seats_available == capacity - accepted
+        and seats_available >= 0
+    )
+    if ok:
+        logger.info("✓ No overselling")
+    else:
+        logger.error("✗ Registration counts are inconsistent")
+    return ok
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000",
+                        help="URL of the running API")
+    parser.add_argument("--users", type=int, default=200,
+                        help="Users competing for the seats")
+    parser.add_argument("--capacity", type=int, default=50,
+                        help="Seats of the stress event")
+    parser.add_argument("--concurrency", type=int, default=50,
+                        help="Parallel client threads")
+    parser.add_argument("--setup-concurrency", type=int, default=8,
+                        help="Parallel threads while creating the users")
+    parser.add_argument("--category-id", type=int, default=1,
+                        help="Existing category for the stress event")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    ok = run_stress(args.base_url, args.users, args.capacity, args.concurrency,
+                    args.category_id, args.setup_concurrency)
+    sys.exit(0 if ok else 1)
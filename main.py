@@ -1,12 +1,29 @@
-from fastapi import FastAPI, HTTPException
+import logging
+import uuid
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.core import exception_handlers
+from app.core.category_cache import category_cache
+from app.core.config import settings
+from app.core.logging_config import request_id_var, setup_logging
+from app.core.metrics import metrics
+from app.core.profiling import finish_profile, should_profile, start_profile
+from app.core.upcoming import upcoming_feed
 from app.db.base import Base
 
 from app.routers.auth import router as auth_router
 from app.routers.user import router as user_router
 from app.routers.events import router as events_router
 from app.routers.category import router as category_router
+from app.routers.metrics import router as metrics_router
+from app.routers.admin import router as admin_router
+from app.routers.query import router as query_router
+from app.tasks import handlers  # noqa: F401 registra los handlers de jobs
+from app.tasks.archiver import event_archiver
+from app.tasks.purger import event_purger
+from app.tasks.queue import job_queue
+
+log_listener = setup_logging(settings.log_level, settings.log_info_sample_rate)
 
 app = FastAPI(
     title="FastAPI App",
@@ -31,6 +48,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def profile_requests(request: Request, call_next):
+    # Registrado antes que add_request_id para quedar dentro de él y
+    # conocer el X-Request-ID de la petición perfilada
+    if not should_profile(request):
+        return await call_next(request)
+    handle = start_profile(request)
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        finish_profile(handle, status_code)
+
+
+@app.middleware("http")
+async def add_request_id(request: Request, call_next):
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+
+@app.middleware("http")
+async def track_inflight_requests(request: Request, call_next):
+    metrics.adjust("http.inflight", 1)
+    try:
+        return await call_next(request)
+    finally:
+        metrics.adjust("http.inflight", -1)
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    try:
+        category_cache.load()
+    except Exception as e:
+        # Se volverá a intentar en el primer acceso
+        logging.error(f"Error loading category cache: {str(e)}")
+    if settings.jobs_enabled:
+        job_queue.start()
+    if settings.upcoming_enabled:
+        # La primera carga se hace en la tarea, sin retrasar el arranque
+        upcoming_feed.start()
+    if settings.purge_enabled:
+        event_purger.start()
+    if settings.archive_enabled:
+        event_archiver.start()
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    await event_purger.stop()
+    await event_archiver.stop()
+    await upcoming_feed.stop()
+    job_queue.stop()
+    log_listener.stop()
+
+
 app.add_exception_handler(HTTPException, exception_handlers.http_exception_handler)
 app.add_exception_handler(404, exception_handlers.not_found_exception_handler)
 
@@ -38,3 +120,6 @@ app.include_router(auth_router, prefix="/auth", tags=["auth"])
 app.include_router(user_router, prefix="/users", tags=["users"])
 app.include_router(events_router, prefix="/events", tags=["events"])
 app.include_router(category_router, prefix="/categories", tags=["categories"])
+app.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
+app.include_router(query_router, prefix="/query", tags=["query"])
+app.include_router(admin_router, prefix="/admin", tags=["admin"])